@@ -3,8 +3,10 @@ Audio utilities for SuperVoxtral.
 
 This module provides:
 - WAV recording from microphone to a file.
+- Single-pass recording straight to MP3 or Opus (PCM piped into ffmpeg).
 - ffmpeg detection.
 - Conversion from WAV to MP3 or Opus using ffmpeg.
+- Silence compression of a WAV before upload.
 - Optional helpers for listing/selecting audio input devices.
 
 Dependencies:
@@ -15,12 +17,13 @@ Dependencies:
 from __future__ import annotations
 
 import logging
-import queue
+import shutil
 import subprocess
+import tempfile
 import time
 from collections.abc import Callable
 from pathlib import Path
-from threading import Event, Thread
+from threading import Event
 from typing import Any
 
 import numpy as np
@@ -31,7 +34,9 @@ __all__ = [
     "timestamp",
     "detect_ffmpeg",
     "convert_audio",
+    "compress_silence",
     "record_wav",
+    "record_and_encode",
     "list_input_devices",
     "default_input_device_index",
 ]
@@ -46,18 +51,173 @@ def timestamp() -> str:
 
 def detect_ffmpeg() -> str | None:
     """
-    Return 'ffmpeg' if available on PATH, otherwise None.
+    Return the path of the ffmpeg executable if it is on PATH, otherwise None.
+
+    A plain PATH lookup (no `ffmpeg -version` spawn), cheap enough to run right before
+    opening the microphone.
     """
-    try:
-        subprocess.run(
-            ["ffmpeg", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
-        )
-        return "ffmpeg"
-    except Exception:
-        return None
+    return shutil.which("ffmpeg")
+
+
+# Silence detection for compress_silence(): a frame is silent below this fraction of
+# the loud frames' RMS; frames under the absolute floor (about -46 dBFS) always are
+_SILENCE_RATIO = 0.1
+_SILENCE_FLOOR = 0.005
+# Frames per block when streaming a file through compress_silence() (10 s at 20 ms)
+_SILENCE_BLOCK_FRAMES = 500
+
+
+def _wait_for_stop(stop_event: Event | None, duration_seconds: float | None = None) -> None:
+    """
+    Block until `stop_event` is set or `duration_seconds` elapses.
 
+    Waits on the event rather than polling it, so the calling thread sleeps for the
+    whole recording instead of waking up (and taking the GIL) every few milliseconds.
+    Without a deadline, a finite timeout keeps KeyboardInterrupt deliverable.
+    """
+    stop = stop_event if stop_event is not None else Event()
+    if duration_seconds is not None:
+        stop.wait(timeout=max(0.0, float(duration_seconds)))
+        return
+    while not stop.wait(timeout=1.0):
+        pass
+
+
+def _capture(
+    write: Callable[[np.ndarray[Any, Any]], None],
+    samplerate: int,
+    channels: int,
+    device: int | str | None,
+    stop_event: Event | None,
+    duration_seconds: float | None,
+    level_callback: Callable[[float], None] | None,
+) -> None:
+    """
+    Capture float32 blocks from an input device and pass each one to `write`.
 
-def convert_audio(input_wav: Path, fmt: str, output_dir: Path | None = None) -> Path:
+    The stream has no callback: PortAudio buffers the audio and the calling thread pulls
+    50 ms blocks with blocking reads, so no Python code runs on the audio thread and no
+    queue or writer thread is needed. Returns when `stop_event` is set, when
+    `duration_seconds` elapses, or on KeyboardInterrupt/EOFError.
+    """
+    # 50 ms blocks: one level per block, matching the 20 Hz meter polling of the UIs
+    blocksize = max(1, samplerate // 20)
+    stop = stop_event if stop_event is not None else Event()
+    deadline = (
+        None if duration_seconds is None else time.monotonic() + max(0.0, float(duration_seconds))
+    )
+    # A high latency gives PortAudio a larger buffer to absorb a slow write()
+    with sd.InputStream(
+        samplerate=samplerate,
+        channels=channels,
+        dtype="float32",
+        device=device,
+        blocksize=blocksize,
+        latency="high",
+    ) as stream:
+        try:
+            while not stop.is_set() and (deadline is None or time.monotonic() < deadline):
+                data, overflowed = stream.read(blocksize)
+                if overflowed:
+                    logging.warning("SoundDevice status: input overflow")
+                write(data)
+                if level_callback is not None:
+                    level_callback(float(np.sqrt(np.mean(data**2))))
+        except (KeyboardInterrupt, EOFError):
+            # Graceful stop on user interrupt
+            pass
+
+
+def _codec_args(fmt: str, speech: bool = False) -> list[str]:
+    """
+    Return the ffmpeg output codec arguments for the given compressed format.
+
+    With `speech`, Opus is tuned for mono voice: wideband (8 kHz cutoff, what a
+    16 kHz transcription model hears anyway), 16 kbps, 20 ms frames and a lower
+    compression level, which encodes faster and uploads less.
+    """
+    if fmt == "mp3":
+        return ["-codec:a", "libmp3lame", "-q:a", "3"]
+    if speech:
+        return [
+            "-c:a",
+            "libopus",
+            "-b:a",
+            "16k",
+            "-application",
+            "voip",
+            "-compression_level",
+            "5",
+            "-frame_duration",
+            "20",
+            "-cutoff",
+            "8000",
+        ]
+    return ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"]
+
+
+class _FfmpegEncoder:
+    """
+    Encode float32 PCM blocks to MP3/Opus by piping them into an ffmpeg process.
+
+    Use as a context manager: `write()` blocks as they are captured; leaving the block
+    closes ffmpeg's stdin, waits for it to finalize the file and raises RuntimeError if
+    it failed (unless another exception is already propagating).
+    """
+
+    def __init__(
+        self, ffmpeg_bin: str, output_path: Path, fmt: str, samplerate: int, channels: int
+    ):
+        cmd = [
+            ffmpeg_bin,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(samplerate),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+            "-vn",
+            *_codec_args(fmt, speech=channels == 1),
+            str(output_path),
+        ]
+        logging.info("Running ffmpeg: %s", " ".join(cmd))
+        # stderr goes to a file, not a pipe: nobody reads a pipe while blocks are written,
+        # so a chatty ffmpeg could fill it, stall, and block write() for good.
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=self._stderr)
+        assert self._proc.stdin is not None
+        self._stdin = self._proc.stdin
+
+    def write(self, data: np.ndarray[Any, Any]) -> None:
+        pcm = (np.clip(data, -1.0, 1.0) * 32767.0).astype("<i2")
+        self._stdin.write(pcm.tobytes())
+
+    def __enter__(self) -> _FfmpegEncoder:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: object, tb: object) -> None:
+        try:
+            self._stdin.close()
+        except OSError:
+            pass
+        returncode = self._proc.wait()
+        self._stderr.seek(0)
+        stderr = self._stderr.read()
+        self._stderr.close()
+        if returncode != 0:
+            logging.error("ffmpeg failed: %s", stderr.decode(errors="replace").strip())
+            if exc_type is None:
+                raise RuntimeError(f"ffmpeg encoding failed with code {returncode}")
+
+
+def convert_audio(
+    input_wav: Path, fmt: str, output_dir: Path | None = None, speech: bool = False
+) -> Path:
     """
     Convert an audio file to the target compressed format using ffmpeg.
 
@@ -65,6 +225,7 @@ def convert_audio(input_wav: Path, fmt: str, output_dir: Path | None = None) ->
         input_wav: Path to the source audio file.
         fmt: Target format, one of {'mp3', 'opus'}.
         output_dir: Directory for the output file. Defaults to the same directory as input_wav.
+        speech: Use the Opus settings tuned for mono voice (ignored for mp3).
 
     Returns:
         Path to the converted file.
@@ -84,34 +245,15 @@ def convert_audio(input_wav: Path, fmt: str, output_dir: Path | None = None) ->
         output_path = output_dir / f"{stem}.{fmt}"
     else:
         output_path = input_wav.with_suffix(f".{fmt}")
-    if fmt == "mp3":
-        cmd = [
-            ffmpeg_bin,
-            "-y",
-            "-i",
-            str(input_wav),
-            "-vn",
-            "-codec:a",
-            "libmp3lame",
-            "-q:a",
-            "3",
-            str(output_path),
-        ]
-    else:  # opus
-        cmd = [
-            ffmpeg_bin,
-            "-y",
-            "-i",
-            str(input_wav),
-            "-vn",
-            "-c:a",
-            "libopus",
-            "-b:a",
-            "24k",
-            "-application",
-            "voip",
-            str(output_path),
-        ]
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-i",
+        str(input_wav),
+        "-vn",
+        *_codec_args(fmt, speech),
+        str(output_path),
+    ]
 
     logging.info("Running ffmpeg: %s", " ".join(cmd))
     proc = subprocess.run(cmd, capture_output=True, text=True)
@@ -121,6 +263,104 @@ def convert_audio(input_wav: Path, fmt: str, output_dir: Path | None = None) ->
     return output_path
 
 
+def compress_silence(
+    input_wav: Path,
+    output_dir: Path,
+    max_silence: float = 0.5,
+    pad: float = 0.2,
+    frame_ms: int = 20,
+) -> Path:
+    """
+    Collapse long silences in a WAV file to a short pad.
+
+    The audio is cut into `frame_ms` frames and a frame is silent when its RMS is
+    below a threshold relative to the loud (95th percentile) frames. Every silent
+    run longer than `max_silence` seconds (including leading/trailing ones) is
+    shortened to `pad` seconds, split evenly around the cut.
+
+    Args:
+        input_wav: Source WAV file.
+        output_dir: Directory for the trimmed file.
+        max_silence: Longest silence (seconds) left untouched.
+        pad: Silence (seconds) kept in place of a longer run.
+        frame_ms: Analysis frame length in milliseconds.
+
+    Returns:
+        Path to the trimmed WAV, or `input_wav` itself if nothing was removed.
+    """
+    info = sf.info(str(input_wav))
+    samplerate, channels = info.samplerate, info.channels
+    frame = samplerate * frame_ms // 1000
+    n_frames = info.frames // frame if frame > 0 else 0
+    if n_frames == 0:
+        return input_wav
+    # The file is streamed in blocks of whole frames (twice): only one block and the
+    # per-frame RMS/keep arrays are held in memory, whatever the recording length
+    blocksize = frame * _SILENCE_BLOCK_FRAMES
+
+    # Pass 1: RMS of each full frame (a trailing partial frame is always kept)
+    rms_blocks: list[np.ndarray[Any, Any]] = []
+    for block in sf.blocks(str(input_wav), blocksize=blocksize, dtype="float32", always_2d=True):
+        n = len(block) // frame
+        if n > 0:
+            frames = block[: n * frame].reshape(n, frame, channels)
+            rms_blocks.append(np.sqrt(np.mean(np.square(frames), axis=(1, 2))))
+    rms = np.concatenate(rms_blocks)[:n_frames]
+    threshold = max(_SILENCE_FLOOR, _SILENCE_RATIO * float(np.percentile(rms, 95)))
+    silent = (rms < threshold).astype(np.int8)
+
+    # Run boundaries: +1 where a silent run starts, -1 one past where it ends
+    edges = np.diff(np.concatenate(([0], silent, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    max_run = int(max_silence * 1000 / frame_ms)
+    pad_frames = int(pad * 1000 / frame_ms)
+    head = pad_frames // 2
+    tail = pad_frames - head
+
+    keep = np.ones(n_frames, dtype=bool)
+    for start, end in zip(starts, ends, strict=True):
+        if end - start > max_run:
+            keep[start + head : end - tail] = False
+    if keep.all():
+        return input_wav
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{input_wav.stem}.wav"
+    if output_path == input_wav:
+        output_path = output_dir / f"{input_wav.stem}_trimmed.wav"
+
+    # Pass 2: copy the kept frames block by block
+    with sf.SoundFile(
+        str(output_path),
+        mode="w",
+        samplerate=samplerate,
+        channels=channels,
+        subtype="PCM_16",
+    ) as out:
+        offset = 0
+        kept_samples = 0
+        for block in sf.blocks(
+            str(input_wav), blocksize=blocksize, dtype="float32", always_2d=True
+        ):
+            n = len(block) // frame
+            frames = block[: n * frame].reshape(n, frame, channels)
+            kept = frames[keep[offset : offset + n]].reshape(-1, channels)
+            rest = block[n * frame :]
+            out.write(kept)
+            out.write(rest)
+            offset += n
+            kept_samples += len(kept) + len(rest)
+
+    logging.info(
+        "Compressed silences in %s: %.2fs -> %.2fs",
+        input_wav,
+        info.frames / samplerate,
+        kept_samples / samplerate,
+    )
+    return output_path
+
+
 def record_wav(
     output_path: Path,
     samplerate: int = 16000,
@@ -170,36 +410,10 @@ def record_wav(
     except Exception:
         logging.debug("Could not query device native sample rate, using %d Hz", samplerate)
 
-    q: queue.Queue = queue.Queue()
-    writer_stop = Event()
-    start_time = time.time()
-
-    def audio_callback(
-        indata: np.ndarray[Any, np.dtype[np.float32]],
-        frames: int,
-        time_info: sd.CallbackFlags,
-        status: sd.CallbackFlags,
-    ) -> None:
-        if status:
-            logging.warning("SoundDevice status: %s", status)
-        q.put(indata.copy())
-        if level_callback is not None:
-            level_callback(float(np.sqrt(np.mean(indata**2))))
-
-    def writer_thread(wav_file: sf.SoundFile) -> None:
-        while not writer_stop.is_set():
-            try:
-                data = q.get(timeout=0.1)
-                wav_file.write(np.clip(data, -1.0, 1.0))
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logging.exception("Error writing WAV data: %s", e)
-                writer_stop.set()
-
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    start_time = time.monotonic()
     with sf.SoundFile(
         str(output_path),
         mode="w",
@@ -207,44 +421,106 @@ def record_wav(
         channels=channels,
         subtype="PCM_16",
     ) as wav_file:
-        with sd.InputStream(
-            samplerate=samplerate,
-            channels=channels,
-            dtype="float32",
-            device=device,
-            callback=audio_callback,
-        ):
-            t = Thread(target=writer_thread, args=(wav_file,), daemon=True)
-            t.start()
-
-            try:
-                if duration_seconds is not None:
-                    # Fixed-duration recording
-                    end_time = start_time + float(duration_seconds)
-                    while time.time() < end_time:
-                        if stop_event is not None and stop_event.is_set():
-                            break
-                        time.sleep(0.05)
-                else:
-                    # Indefinite recording until stop_event or interrupt
-                    while True:
-                        if stop_event is not None and stop_event.is_set():
-                            break
-                        time.sleep(0.05)
-            except (KeyboardInterrupt, EOFError):
-                # Graceful stop on user interrupt
-                pass
-            finally:
-                writer_stop.set()
-                t.join()
-
-    duration = time.time() - start_time
+        _capture(
+            lambda data: wav_file.write(np.clip(data, -1.0, 1.0)),
+            samplerate,
+            channels,
+            device,
+            stop_event,
+            duration_seconds,
+            level_callback,
+        )
+
+    duration = time.monotonic() - start_time
     logging.info(
         "Recorded WAV %s (%.2fs @ %d Hz, %d ch)", output_path, duration, samplerate, channels
     )
     return duration
 
 
+def record_and_encode(
+    output_path: Path,
+    fmt: str,
+    samplerate: int = 16000,
+    channels: int = 1,
+    device: int | str | None = None,
+    duration_seconds: float | None = None,
+    stop_event: Event | None = None,
+    level_callback: Callable[[float], None] | None = None,
+    ffmpeg_bin: str | None = None,
+) -> float:
+    """
+    Record audio and encode it to MP3/Opus on the fly, without an intermediate WAV.
+
+    Captured PCM blocks are converted to 16-bit little-endian samples and piped into
+    an ffmpeg process that writes `output_path` directly. Stop conditions are the
+    same as for `record_wav`.
+
+    Args:
+        output_path: Destination file path (.mp3 or .opus).
+        fmt: Target format, one of {'mp3', 'opus'}.
+        samplerate: Sample rate in Hz (the device's native rate is preferred).
+        channels: Number of channels (1=mono, 2=stereo).
+        device: Input device index or name. None uses the default device.
+        duration_seconds: Fixed recording duration. If None, run until stop_event or interrupt.
+        stop_event: External stop flag.
+        level_callback: Optional callback receiving the RMS level of each captured block.
+        ffmpeg_bin: ffmpeg executable already found by the caller (looked up if None).
+
+    Returns:
+        The recorded duration in seconds (float).
+
+    Raises:
+        AssertionError: If fmt is not supported.
+        RuntimeError: If ffmpeg is not available or encoding fails.
+    """
+    assert fmt in {"mp3", "opus"}, "fmt must be 'mp3' or 'opus'"
+    if channels < 1:
+        raise ValueError("channels must be >= 1")
+    if samplerate <= 0:
+        raise ValueError("samplerate must be > 0")
+    ffmpeg_bin = ffmpeg_bin or detect_ffmpeg()
+    if not ffmpeg_bin:
+        raise RuntimeError("ffmpeg not found. Please install ffmpeg (e.g., brew install ffmpeg).")
+
+    # Use the device's native sample rate to avoid PortAudio resampling artifacts
+    try:
+        dev_info = sd.query_devices(device, "input")
+        native_rate = int(dev_info["default_samplerate"])
+        if native_rate > 0:
+            logging.info(
+                "Using device native sample rate %d Hz (requested %d Hz)", native_rate, samplerate
+            )
+            samplerate = native_rate
+    except Exception:
+        logging.debug("Could not query device native sample rate, using %d Hz", samplerate)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    start_time = time.monotonic()
+    with _FfmpegEncoder(ffmpeg_bin, output_path, fmt, samplerate, channels) as encoder:
+        _capture(
+            encoder.write,
+            samplerate,
+            channels,
+            device,
+            stop_event,
+            duration_seconds,
+            level_callback,
+        )
+
+    duration = time.monotonic() - start_time
+    logging.info(
+        "Recorded %s %s (%.2fs @ %d Hz, %d ch)",
+        fmt,
+        output_path,
+        duration,
+        samplerate,
+        channels,
+    )
+    return duration
+
+
 def list_input_devices() -> list[dict[str, Any]]:
     """
     Return a list of available input devices with basic metadata.
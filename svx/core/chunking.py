@@ -24,6 +24,7 @@ from svx.providers.base import TranscriptionSegment
 __all__ = [
     "ChunkInfo",
     "get_audio_duration",
+    "get_audio_channels",
     "split_audio",
     "merge_segments",
     "merge_texts",
@@ -146,6 +147,35 @@ def get_audio_duration(audio_path: Path) -> float:
     return float(proc.stdout.strip())
 
 
+def get_audio_channels(audio_path: Path) -> int:
+    """Return the channel count of the first audio stream via ffprobe.
+
+    Raises RuntimeError if ffprobe is unavailable or fails.
+    """
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=channels",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(audio_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError("ffprobe not found. Please install ffmpeg (e.g., brew install ffmpeg).")
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffprobe failed: {proc.stderr.strip()}")
+    return int(proc.stdout.strip())
+
+
 def _split_audio_ffmpeg(
     audio_path: Path,
     chunk_duration: int = 300,
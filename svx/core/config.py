@@ -24,10 +24,12 @@ This module aims to remain small and import-safe.
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 import sys
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Final
 
@@ -138,6 +140,10 @@ def _configure_logging(level: str) -> None:
     root_logger.addHandler(file_handler)
 
 
+# Third-party loggers capped at WARNING by setup_environment()
+_NOISY_LOGGERS: Final[tuple[str, ...]] = ("httpx", "httpcore", "urllib3", "sounddevice")
+
+
 def setup_environment(log_level: str = "INFO") -> None:
     """
     Ensure project directories exist and configure logging.
@@ -164,6 +170,11 @@ def setup_environment(log_level: str = "INFO") -> None:
     stream_handler.setFormatter(formatter)
     root_logger.addHandler(stream_handler)
 
+    # Third-party libraries log per request/connection at DEBUG/INFO; keep them quiet so
+    # debug runs do not format and print that traffic while recording
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
 
 def _read_toml(path: Path) -> dict[str, Any]:
     """
@@ -177,6 +188,17 @@ def _read_toml(path: Path) -> dict[str, Any]:
         return {}
 
 
+@lru_cache(maxsize=4)
+def _load_cached(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse the TOML file at `path`, memoized on its stat signature.
+
+    `mtime_ns` and `size` are only part of the cache key: any edit to the file
+    changes them and forces a re-parse.
+    """
+    return _read_toml(path)
+
+
 def load_user_config() -> dict[str, Any]:
     """
     Load and return a dictionary representing the user's configuration (from USER_CONFIG_FILE).
@@ -200,10 +222,15 @@ def load_user_config() -> dict[str, Any]:
     # optional: either file or text
     file = "~/path/to/user.md"
     text = "inline prompt text (less recommended)"
+
+    The parsed content is cached per (path, mtime, size); callers get a deep copy
+    so they can never mutate the cached dict.
     """
-    if not USER_CONFIG_FILE.exists():
+    try:
+        st = USER_CONFIG_FILE.stat()
+    except OSError:
         return {}
-    return _read_toml(USER_CONFIG_FILE)
+    return copy.deepcopy(_load_cached(USER_CONFIG_FILE, st.st_mtime_ns, st.st_size))
 
 
 def init_user_config(force: bool = False, prompt_file: Path | None = None) -> Path:
@@ -243,7 +270,7 @@ def init_user_config(force: bool = False, prompt_file: Path | None = None) -> Pa
         '# Provider to use (currently supported: "mistral")\n'
         'provider = "mistral"\n\n'
         '# File format sent to the provider: "wav" | "mp3" | "opus"\n'
-        '# Recording is always WAV; conversion is applied if "mp3" or "opus"\n'
+        '# "mp3"/"opus" are encoded while recording (or converted from the kept raw WAV)\n'
         'format = "opus"\n\n'
         "# Model for audio transcription (dedicated endpoint)\n"
         'model = "voxtral-mini-latest"\n\n'
@@ -262,6 +289,10 @@ def init_user_config(force: bool = False, prompt_file: Path | None = None) -> Pa
         "# Recordings longer than chunk_duration are split into overlapping chunks\n"
         "chunk_duration = 300   # 5 minutes\n"
         "chunk_overlap = 30     # 30s overlap between chunks\n\n"
+        "# Shorten silences longer than 0.5s to 0.2s before upload (less audio to\n"
+        "# transcribe). Timestamps then refer to the trimmed audio, and mp3/opus are\n"
+        "# no longer encoded while recording.\n"
+        "trim_silence = false\n\n"
         "# Loopback device for dual audio capture (mic + system audio)\n\n"
         '# Set to your loopback device name (e.g. "BlackHole 2ch") to capture both\n'
         "# Leave commented out to record microphone only\n"
@@ -333,6 +364,7 @@ class DefaultsConfig:
     diarize: bool = True
     chunk_duration: int = 300
     chunk_overlap: int = 30
+    trim_silence: bool = False
     loopback_device: str | None = None
     mic_gain: float = 1.0
     loopback_gain: float = 1.0
@@ -386,6 +418,7 @@ class Config:
             "diarize": bool(user_defaults_raw.get("diarize", True)),
             "chunk_duration": int(user_defaults_raw.get("chunk_duration", 300)),
             "chunk_overlap": int(user_defaults_raw.get("chunk_overlap", 30)),
+            "trim_silence": bool(user_defaults_raw.get("trim_silence", False)),
             "loopback_device": user_defaults_raw.get("loopback_device"),
             "mic_gain": float(user_defaults_raw.get("mic_gain", 1.0)),
             "loopback_gain": float(user_defaults_raw.get("loopback_gain", 1.0)),
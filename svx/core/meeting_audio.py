@@ -2,7 +2,7 @@
 Dual-device audio recording for SuperVoxtral.
 
 Captures audio from two input devices simultaneously (e.g. microphone + system loopback)
-and mixes them into a single mono WAV file.
+and mixes them into a single mono WAV file, or encodes the mix to MP3/Opus on the fly.
 
 The two device callbacks fire independently (unsynchronized clocks). To produce a clean
 mix, each source accumulates raw samples into its own buffer. A writer thread periodically
@@ -29,8 +29,11 @@ import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
+from svx.core.audio import _FfmpegEncoder, _wait_for_stop, detect_ffmpeg
+
 __all__ = [
     "record_dual_wav",
+    "record_dual_and_encode",
     "find_loopback_device",
 ]
 
@@ -60,38 +63,8 @@ def find_loopback_device(name: str) -> int | None:
     return None
 
 
-def record_dual_wav(
-    output_path: Path,
-    mic_device: int | str | None,
-    loopback_device: int | str,
-    samplerate: int = 16000,
-    stop_event: Event | None = None,
-    mic_gain: float = 1.0,
-    loopback_gain: float = 1.0,
-    mic_level_cb: Callable[[float], None] | None = None,
-    loop_level_cb: Callable[[float], None] | None = None,
-) -> float:
-    """
-    Record from two input devices simultaneously into a mono WAV file.
-
-    Both sources (mic + loopback) are averaged together with optional gain
-    adjustment per source.
-
-    Args:
-        output_path: Destination WAV file path (mono).
-        mic_device: Microphone device index or name. None for default.
-        loopback_device: Loopback device index or name (e.g. BlackHole).
-        samplerate: Sample rate in Hz.
-        stop_event: External stop flag. If None, records until KeyboardInterrupt.
-        mic_gain: Gain multiplier for microphone (1.0 = no change, 0.5 = half, 2.0 = double).
-        loopback_gain: Gain multiplier for loopback (1.0 = no change, 0.5 = half, 2.0 = double).
-
-    Returns:
-        Recording duration in seconds.
-    """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Use the mic device's native sample rate to avoid PortAudio resampling artifacts
+def _mic_native_rate(mic_device: int | str | None, samplerate: int) -> int:
+    """Return the mic device's native sample rate (avoids PortAudio resampling artifacts)."""
     try:
         dev_info = sd.query_devices(mic_device, "input")
         native_rate = int(dev_info["default_samplerate"])
@@ -99,16 +72,40 @@ def record_dual_wav(
             logging.info(
                 "Using device native sample rate %d Hz (requested %d Hz)", native_rate, samplerate
             )
-            samplerate = native_rate
+            return native_rate
     except Exception:
         logging.debug("Could not query device native sample rate, using %d Hz", samplerate)
+    return samplerate
+
+
+def _record_dual(
+    write: Callable[[np.ndarray[Any, Any]], None],
+    mic_device: int | str | None,
+    loopback_device: int | str,
+    samplerate: int,
+    stop_event: Event | None,
+    mic_gain: float,
+    loopback_gain: float,
+    mic_level_cb: Callable[[float], None] | None,
+    loop_level_cb: Callable[[float], None] | None,
+) -> float:
+    """
+    Capture both devices and pass the mono mix to `write` until stopped.
 
+    If `write` fails, recording stops and the error is raised once the streams are closed.
+
+    Returns:
+        Recording duration in seconds.
+    """
     # Raw sample queues — callbacks push float32 arrays in [-1.0, 1.0]
     mic_q: queue.Queue[np.ndarray[Any, np.dtype[np.float32]]] = queue.Queue()
     loop_q: queue.Queue[np.ndarray[Any, np.dtype[np.float32]]] = queue.Queue()
 
     writer_stop = Event()
-    start_time = time.time()
+    # Set by the caller, or by the writer when `write` fails
+    stop = stop_event if stop_event is not None else Event()
+    writer_errors: list[Exception] = []
+    start_time = time.monotonic()
 
     def mic_callback(
         indata: np.ndarray[Any, np.dtype[np.float32]],
@@ -149,20 +146,28 @@ def record_dual_wav(
         return np.concatenate(blocks).flatten()
 
     def _mix_and_write(
-        wav_file: sf.SoundFile,
         mic_carry: np.ndarray[Any, np.dtype[np.float32]],
         loop_carry: np.ndarray[Any, np.dtype[np.float32]],
     ) -> tuple[np.ndarray[Any, np.dtype[np.float32]], np.ndarray[Any, np.dtype[np.float32]]]:
-        """Mix overlapping samples from both carries, write to file, return remainders."""
+        """Mix overlapping samples from both carries, write the mix, return remainders."""
         mix_len = min(len(mic_carry), len(loop_carry))
         if mix_len > 0:
             mixed = mic_carry[:mix_len] * mic_gain + loop_carry[:mix_len] * loopback_gain
-            wav_file.write(np.clip(mixed, -1.0, 1.0))
+            write(np.clip(mixed, -1.0, 1.0))
             mic_carry = mic_carry[mix_len:]
             loop_carry = loop_carry[mix_len:]
         return mic_carry, loop_carry
 
-    def writer_thread(wav_file: sf.SoundFile) -> None:
+    def writer_thread() -> None:
+        """Run the writer loop; on failure, keep the error and stop the recording."""
+        try:
+            _writer_loop()
+        except Exception as e:
+            logging.exception("Error writing dual-device audio: %s", e)
+            writer_errors.append(e)
+            stop.set()
+
+    def _writer_loop() -> None:
         """Periodically drain both queues, mix the overlapping part, write."""
         mic_carry = np.array([], dtype=np.float32)
         loop_carry = np.array([], dtype=np.float32)
@@ -177,7 +182,7 @@ def record_dual_wav(
             if len(loop_new) > 0:
                 loop_carry = np.concatenate([loop_carry, loop_new])
 
-            mic_carry, loop_carry = _mix_and_write(wav_file, mic_carry, loop_carry)
+            mic_carry, loop_carry = _mix_and_write(mic_carry, loop_carry)
 
         # Final drain after stop
         mic_new = _drain_queue(mic_q)
@@ -187,13 +192,77 @@ def record_dual_wav(
         if len(loop_new) > 0:
             loop_carry = np.concatenate([loop_carry, loop_new])
 
-        mic_carry, loop_carry = _mix_and_write(wav_file, mic_carry, loop_carry)
+        mic_carry, loop_carry = _mix_and_write(mic_carry, loop_carry)
 
         # Write any leftover from whichever source has more (with gain applied)
         if len(mic_carry) > 0:
-            wav_file.write(np.clip(mic_carry * mic_gain, -1.0, 1.0))
+            write(np.clip(mic_carry * mic_gain, -1.0, 1.0))
         if len(loop_carry) > 0:
-            wav_file.write(np.clip(loop_carry * loopback_gain, -1.0, 1.0))
+            write(np.clip(loop_carry * loopback_gain, -1.0, 1.0))
+
+    mic_stream = sd.InputStream(
+        samplerate=samplerate,
+        channels=1,
+        dtype="float32",
+        device=mic_device,
+        callback=mic_callback,
+    )
+    loop_stream = sd.InputStream(
+        samplerate=samplerate,
+        channels=1,
+        dtype="float32",
+        device=loopback_device,
+        callback=loop_callback,
+    )
+
+    with mic_stream, loop_stream:
+        t = Thread(target=writer_thread, daemon=True)
+        t.start()
+
+        try:
+            _wait_for_stop(stop)
+        except (KeyboardInterrupt, EOFError):
+            pass
+        finally:
+            writer_stop.set()
+            t.join()
+
+    if writer_errors:
+        raise writer_errors[0]
+    return time.monotonic() - start_time
+
+
+def record_dual_wav(
+    output_path: Path,
+    mic_device: int | str | None,
+    loopback_device: int | str,
+    samplerate: int = 16000,
+    stop_event: Event | None = None,
+    mic_gain: float = 1.0,
+    loopback_gain: float = 1.0,
+    mic_level_cb: Callable[[float], None] | None = None,
+    loop_level_cb: Callable[[float], None] | None = None,
+) -> float:
+    """
+    Record from two input devices simultaneously into a mono WAV file.
+
+    Both sources (mic + loopback) are averaged together with optional gain
+    adjustment per source.
+
+    Args:
+        output_path: Destination WAV file path (mono).
+        mic_device: Microphone device index or name. None for default.
+        loopback_device: Loopback device index or name (e.g. BlackHole).
+        samplerate: Sample rate in Hz.
+        stop_event: External stop flag. If None, records until KeyboardInterrupt.
+        mic_gain: Gain multiplier for microphone (1.0 = no change, 0.5 = half, 2.0 = double).
+        loopback_gain: Gain multiplier for loopback (1.0 = no change, 0.5 = half, 2.0 = double).
+
+    Returns:
+        Recording duration in seconds.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    samplerate = _mic_native_rate(mic_device, samplerate)
 
     with sf.SoundFile(
         str(output_path),
@@ -202,37 +271,18 @@ def record_dual_wav(
         channels=1,
         subtype="PCM_16",
     ) as wav_file:
-        mic_stream = sd.InputStream(
-            samplerate=samplerate,
-            channels=1,
-            dtype="float32",
-            device=mic_device,
-            callback=mic_callback,
-        )
-        loop_stream = sd.InputStream(
-            samplerate=samplerate,
-            channels=1,
-            dtype="float32",
-            device=loopback_device,
-            callback=loop_callback,
+        duration = _record_dual(
+            wav_file.write,
+            mic_device,
+            loopback_device,
+            samplerate,
+            stop_event,
+            mic_gain,
+            loopback_gain,
+            mic_level_cb,
+            loop_level_cb,
         )
 
-        with mic_stream, loop_stream:
-            t = Thread(target=writer_thread, args=(wav_file,), daemon=True)
-            t.start()
-
-            try:
-                while True:
-                    if stop_event is not None and stop_event.is_set():
-                        break
-                    time.sleep(0.05)
-            except (KeyboardInterrupt, EOFError):
-                pass
-            finally:
-                writer_stop.set()
-                t.join()
-
-    duration = time.time() - start_time
     logging.info(
         "Recorded dual WAV %s (%.2fs @ %d Hz, mono mix: mic + loopback)",
         output_path,
@@ -240,3 +290,65 @@ def record_dual_wav(
         samplerate,
     )
     return duration
+
+
+def record_dual_and_encode(
+    output_path: Path,
+    fmt: str,
+    mic_device: int | str | None,
+    loopback_device: int | str,
+    samplerate: int = 16000,
+    stop_event: Event | None = None,
+    mic_gain: float = 1.0,
+    loopback_gain: float = 1.0,
+    mic_level_cb: Callable[[float], None] | None = None,
+    loop_level_cb: Callable[[float], None] | None = None,
+    ffmpeg_bin: str | None = None,
+) -> float:
+    """
+    Record from two input devices and encode the mono mix to MP3/Opus on the fly.
+
+    Same capture and mixing as `record_dual_wav`, but the mix is piped into ffmpeg
+    while recording, so no intermediate WAV is written.
+
+    Args:
+        output_path: Destination file path (.mp3 or .opus).
+        fmt: Target format, one of {'mp3', 'opus'}.
+        ffmpeg_bin: ffmpeg executable already found by the caller (looked up if None).
+        (other arguments as for `record_dual_wav`)
+
+    Returns:
+        Recording duration in seconds.
+
+    Raises:
+        AssertionError: If fmt is not supported.
+        RuntimeError: If ffmpeg is not available or encoding fails.
+    """
+    assert fmt in {"mp3", "opus"}, "fmt must be 'mp3' or 'opus'"
+    ffmpeg_bin = ffmpeg_bin or detect_ffmpeg()
+    if not ffmpeg_bin:
+        raise RuntimeError("ffmpeg not found. Please install ffmpeg (e.g., brew install ffmpeg).")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    samplerate = _mic_native_rate(mic_device, samplerate)
+
+    with _FfmpegEncoder(ffmpeg_bin, output_path, fmt, samplerate, 1) as encoder:
+        duration = _record_dual(
+            encoder.write,
+            mic_device,
+            loopback_device,
+            samplerate,
+            stop_event,
+            mic_gain,
+            loopback_gain,
+            mic_level_cb,
+            loop_level_cb,
+        )
+
+    logging.info(
+        "Recorded dual %s %s (%.2fs @ %d Hz, mono mix: mic + loopback)",
+        fmt,
+        output_path,
+        duration,
+        samplerate,
+    )
+    return duration
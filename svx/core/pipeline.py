@@ -6,6 +6,7 @@ import tempfile
 import threading
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from logging import FileHandler
 from pathlib import Path
 from typing import Any
@@ -13,9 +14,17 @@ from typing import Any
 import soundfile as sf
 
 import svx.core.config as config
-from svx.core.audio import convert_audio, record_wav, timestamp
+from svx.core.audio import (
+    compress_silence,
+    convert_audio,
+    detect_ffmpeg,
+    record_and_encode,
+    record_wav,
+    timestamp,
+)
 from svx.core.chunking import (
     ChunkInfo,
+    get_audio_channels,
     get_audio_duration,
     merge_segments,
     merge_texts,
@@ -48,6 +57,24 @@ def _needs_conversion(input_path: Path, audio_format: str) -> bool:
     return True
 
 
+def _unlink_if_present(path: Path) -> bool:
+    """Delete a file in a single syscall; return False if it did not exist."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+class PipelineCanceled(Exception):
+    """
+    Raised by RecordingPipeline.process() when its cancel_event is set.
+
+    Cancellation is checked between steps (and between chunks), so a request that is
+    already in flight completes but its result is discarded.
+    """
+
+
 class RecordingPipeline:
     """
     Centralized pipeline for recording audio, transcribing via provider, optionally
@@ -64,8 +91,14 @@ class RecordingPipeline:
     Optional progress_callback for status updates (e.g., for GUI).
     Supports transcribe_mode for pure transcription without prompt (step 1 only).
     Supports dual-device recording (mic + loopback) when loopback_device is configured.
+    Optional cancel_event aborts process() at the next step boundary (PipelineCanceled).
     """
 
+    # WAVs below this size are uploaded as-is instead of being converted to mp3/opus
+    # (about 10 s of 16 kHz or 3 s of 48 kHz mono): for clips this short, spawning ffmpeg
+    # takes about as long as uploading the extra bytes. Longer clips are always encoded.
+    SKIP_ENCODE_BYTES = 320_000
+
     def __init__(
         self,
         cfg: Config,
@@ -76,6 +109,7 @@ class RecordingPipeline:
         progress_callback: Callable[[str], None] | None = None,
         transcribe_mode: bool = False,
         level_monitor: object | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> None:
         self.cfg = cfg
         self.user_prompt = user_prompt
@@ -85,9 +119,11 @@ class RecordingPipeline:
         self.progress_callback = progress_callback
         self.transcribe_mode = transcribe_mode
         self.level_monitor = level_monitor
+        self.cancel_event = cancel_event
         self._chunk_dir: Path | None = None  # temp dir for chunk files
         self._convert_dir: Path | None = None  # temp dir for conversion output
         self._recording_base: str | None = None  # base name set during record()
+        self._encoded_path: Path | None = None  # set when record() encoded on the fly
 
     def _status(self, msg: str) -> None:
         """Emit status update via callback if provided."""
@@ -95,12 +131,32 @@ class RecordingPipeline:
             self.progress_callback(msg)
         logging.info(msg)
 
+    def _check_canceled(self) -> None:
+        """Raise PipelineCanceled if cancellation was requested."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise PipelineCanceled("Processing canceled.")
+
+    def _warm_up_provider(self) -> None:
+        """Build the provider (and its client, if it supports warm_up) ahead of use."""
+        try:
+            prov = get_provider(self.cfg.defaults.provider, cfg=self.cfg)
+            warm_up = getattr(prov, "warm_up", None)
+            if warm_up is not None:
+                warm_up()
+        except Exception as e:
+            # Not fatal here: the same error is raised again when transcribing
+            logging.debug("Provider warm-up failed: %s", e)
+
     def record(self, stop_event: threading.Event | None = None) -> tuple[Path, float]:
         """
         Record audio and return wav_path, duration.
 
         Uses dual-device recording if loopback_device is configured.
 
+        When the raw WAV is not kept and the target format is mp3/opus, the recording
+        (single-device, or the dual-device mix) is piped straight into ffmpeg, so the
+        returned path is already the compressed file and no WAV is written at all.
+
         Returns:
             tuple[Path, float]: wav_path, duration.
         """
@@ -123,8 +179,23 @@ class RecordingPipeline:
 
         stop_for_recording = stop_event or threading.Event()
 
+        # Let the provider import its SDK and set up its client while the user speaks
+        threading.Thread(
+            target=self._warm_up_provider, name="svx-provider-warmup", daemon=True
+        ).start()
+
+        # Silence compression works on the raw WAV, so it rules out encoding on the fly.
+        # ffmpeg is looked up once here and handed to the encoder.
+        ffmpeg_bin = detect_ffmpeg() if audio_format in {"mp3", "opus"} else None
+        encode_on_the_fly = (
+            ffmpeg_bin is not None and not keep_raw and not self.cfg.defaults.trim_silence
+        )
+
         # Determine output path
-        if keep_raw:
+        if encode_on_the_fly:
+            wav_path = Path(tempfile.mktemp(suffix=f".{audio_format}"))
+            self._encoded_path = wav_path
+        elif keep_raw:
             self.cfg.recordings_dir.mkdir(parents=True, exist_ok=True)
             wav_path = self.cfg.recordings_dir / f"{base}.wav"
         else:
@@ -132,7 +203,11 @@ class RecordingPipeline:
 
         # Dual-device or single-device recording
         if loopback_device:
-            from svx.core.meeting_audio import find_loopback_device, record_dual_wav
+            from svx.core.meeting_audio import (
+                find_loopback_device,
+                record_dual_and_encode,
+                record_dual_wav,
+            )
 
             self._status("Recording (dual: mic + loopback)...")
             loop_idx = find_loopback_device(loopback_device)
@@ -143,8 +218,13 @@ class RecordingPipeline:
                 )
             _mic_cb = getattr(self.level_monitor, "push_mic", None)
             _loop_cb = getattr(self.level_monitor, "push_loop", None)
-            duration = record_dual_wav(
-                wav_path,
+            if encode_on_the_fly:
+                record_dual = partial(
+                    record_dual_and_encode, wav_path, audio_format, ffmpeg_bin=ffmpeg_bin
+                )
+            else:
+                record_dual = partial(record_dual_wav, wav_path)
+            duration = record_dual(
                 mic_device=device,
                 loopback_device=loop_idx,
                 samplerate=rate,
@@ -154,6 +234,19 @@ class RecordingPipeline:
                 mic_level_cb=_mic_cb,
                 loop_level_cb=_loop_cb,
             )
+        elif encode_on_the_fly:
+            self._status("Recording...")
+            _mic_cb = getattr(self.level_monitor, "push_mic", None)
+            duration = record_and_encode(
+                wav_path,
+                audio_format,
+                samplerate=rate,
+                channels=channels,
+                device=device,
+                stop_event=stop_for_recording,
+                level_callback=_mic_cb,
+                ffmpeg_bin=ffmpeg_bin,
+            )
         else:
             self._status("Recording...")
             _mic_cb = getattr(self.level_monitor, "push_mic", None)
@@ -256,6 +349,7 @@ class RecordingPipeline:
         self._chunk_dir = chunks[0].path.parent if chunks and chunks[0].path != audio_path else None
 
         def _transcribe_chunk(chunk: ChunkInfo) -> tuple[int, TranscriptionResult]:
+            self._check_canceled()
             prov = get_provider(provider_name, cfg=self.cfg)
             result = self._transcribe_single(
                 chunk.path, provider_name, model, language, diarize, prov=prov
@@ -273,6 +367,11 @@ class RecordingPipeline:
         with ThreadPoolExecutor(max_workers=4) as executor:
             futures = {executor.submit(_transcribe_chunk, chunk): chunk for chunk in chunks}
             for future in as_completed(futures):
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    # Drop chunks not started yet; the executor waits for in-flight ones
+                    for pending in futures:
+                        pending.cancel()
+                    self._check_canceled()
                 idx, result = future.result()
                 results_by_index[idx] = result
                 self._status(f"Chunk {idx + 1}/{len(chunks)} done.")
@@ -320,7 +419,11 @@ class RecordingPipeline:
         Returns:
             Dict with 'text' (str), 'raw_transcript' (str), 'raw' (dict),
             'duration' (float), 'paths' (dict of Path or None).
+
+        Raises:
+            PipelineCanceled: If cancel_event is set before a step starts.
         """
+        self._check_canceled()
         # Resolve parameters
         provider = self.cfg.defaults.provider
         audio_format = self.cfg.defaults.format
@@ -344,7 +447,7 @@ class RecordingPipeline:
         else:
             self._status("Transcribe mode: transcription only, no prompt.")
 
-        logging.debug(f"Applied prompt: {final_user_prompt or 'None (transcribe mode)'}")
+        logging.debug("Applied prompt: %s", final_user_prompt or "None (transcribe mode)")
 
         paths: dict[str, Path | None] = {"wav": wav_path}
 
@@ -352,15 +455,37 @@ class RecordingPipeline:
         # Use a dedicated temp directory so conversion output never appears next to the
         # user's source file (important for the `svx process` command).
         to_send_path = wav_path
-        if _needs_conversion(wav_path, audio_format):
+        if self.cfg.defaults.trim_silence and wav_path.suffix.lower() == ".wav":
+            self._status("Trimming silences...")
+            if self._convert_dir is None:
+                self._convert_dir = Path(tempfile.mkdtemp(prefix="svx_convert_"))
+            to_send_path = compress_silence(wav_path, self._convert_dir)
+        keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
+        small_wav = (
+            not keep_compressed
+            and to_send_path.suffix.lower() == ".wav"
+            and to_send_path.stat().st_size < self.SKIP_ENCODE_BYTES
+        )
+        if small_wav and _needs_conversion(to_send_path, audio_format):
+            self._status("Skipping encode (small file).")
+        elif _needs_conversion(to_send_path, audio_format):
             self._status("Converting...")
             if self._convert_dir is None:
                 self._convert_dir = Path(tempfile.mkdtemp(prefix="svx_convert_"))
-            to_send_path = convert_audio(wav_path, audio_format, output_dir=self._convert_dir)
-            logging.info("Converted %s -> %s", wav_path, to_send_path)
+            source_path = to_send_path
+            to_send_path = convert_audio(
+                source_path,
+                audio_format,
+                output_dir=self._convert_dir,
+                speech=self._is_mono(source_path),
+            )
+            logging.info("Converted %s -> %s", source_path, to_send_path)
             paths["converted"] = to_send_path
         else:
             logging.info("Skipping conversion: %s already in compatible format", wav_path.name)
+            if wav_path == self._encoded_path:
+                # Encoded during record(): this temp file is the compressed output
+                paths["converted"] = wav_path
 
         # Get actual audio duration from file (fall back to wall-clock duration)
         audio_duration = self._get_audio_duration(to_send_path, fallback=duration)
@@ -382,6 +507,7 @@ class RecordingPipeline:
                     paths["converted"] = final
 
         # Step 1: Transcription (with optional chunking and diarization)
+        self._check_canceled()
         if audio_duration > chunk_duration:
             self._status(
                 f"Long recording ({audio_duration:.0f}s > {chunk_duration}s): chunking enabled."
@@ -402,6 +528,7 @@ class RecordingPipeline:
 
         # Step 2: Transformation (if prompt)
         if not transcribe_mode and final_user_prompt:
+            self._check_canceled()
             self._status("Applying prompt...")
             chat_model = self.cfg.defaults.chat_model
             prov = get_provider(provider, cfg=self.cfg)
@@ -416,6 +543,7 @@ class RecordingPipeline:
             raw = result["raw"]
 
         # Save if keeping transcripts
+        self._check_canceled()
         if keep_transcript:
             self.cfg.transcripts_dir.mkdir(parents=True, exist_ok=True)
             txt_path, json_path = save_transcript(
@@ -450,6 +578,18 @@ class RecordingPipeline:
             "paths": paths,
         }
 
+    def _is_mono(self, audio_path: Path) -> bool:
+        """Return True if the file has a single channel (False when it cannot be read)."""
+        try:
+            return sf.info(str(audio_path)).channels == 1
+        except Exception:
+            pass
+        try:
+            return get_audio_channels(audio_path) == 1
+        except Exception:
+            logging.debug("Could not read channel count of %s", audio_path)
+            return False
+
     def _get_audio_duration(self, audio_path: Path, fallback: float = 0.0) -> float:
         """Get audio duration in seconds from file metadata, with fallback."""
         try:
@@ -483,24 +623,25 @@ class RecordingPipeline:
             keep_raw: Whether to keep the raw WAV file.
             keep_compressed: Whether to keep the compressed audio file (mp3/opus).
         """
-        if not keep_raw and wav_path.exists():
-            wav_path.unlink()
+        # A file encoded during record() is never the raw WAV: it is kept only by
+        # being moved to recordings/ in process() (keep_compressed).
+        is_temp_encoded = wav_path == self._encoded_path
+        if (not keep_raw or is_temp_encoded) and _unlink_if_present(wav_path):
             logging.info("Deleted temp WAV: %s", wav_path)
 
         if not keep_compressed:
-            if "converted" in paths and paths["converted"] and paths["converted"] != wav_path:
-                if paths["converted"].exists():
-                    paths["converted"].unlink()
-                    logging.info("Deleted temp converted: %s", paths["converted"])
+            converted = paths.get("converted")
+            if converted and converted != wav_path and _unlink_if_present(converted):
+                logging.info("Deleted temp converted: %s", converted)
 
-        # Clean up chunk temp directory
-        if self._chunk_dir and self._chunk_dir.exists():
+        # Clean up temp directories (rmtree ignores missing ones; the conversion dir may
+        # already be empty if the file was moved to recordings)
+        if self._chunk_dir:
             shutil.rmtree(self._chunk_dir, ignore_errors=True)
             logging.info("Deleted temp chunk dir: %s", self._chunk_dir)
             self._chunk_dir = None
 
-        # Clean up conversion temp directory (may already be empty if file was moved to recordings)
-        if self._convert_dir and self._convert_dir.exists():
+        if self._convert_dir:
             shutil.rmtree(self._convert_dir, ignore_errors=True)
             logging.info("Deleted temp convert dir: %s", self._convert_dir)
             self._convert_dir = None
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 from .config import USER_PROMPT_DIR, Config, PromptEntry
@@ -25,13 +26,30 @@ __all__ = [
 ]
 
 
-def read_text_file(path: Path | str) -> str:
+@lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file once per (path, mtime, size): an edited file gets a new cache key."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def read_text_file(path: Path | str, missing_ok: bool = False) -> str:
     """
     Read a UTF-8 text file and return its content.
     Returns an empty string if the file is missing or unreadable.
+
+    Contents are memoized per modification time and size, so prompt files are only
+    read again after they change. With `missing_ok`, a missing file is not logged
+    (callers use this instead of an extra exists() check).
     """
     try:
-        return Path(path).read_text(encoding="utf-8")
+        # Key on the absolute path: a relative one may name another file after a chdir
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        return _read_text_cached(str(resolved), st.st_mtime_ns, st.st_size)
+    except FileNotFoundError as e:
+        if not missing_ok:
+            logging.warning("Failed to read text file %s: %s", path, e)
+        return ""
     except Exception as e:
         logging.warning("Failed to read text file %s: %s", path, e)
         return ""
@@ -49,11 +67,9 @@ def resolve_prompt(inline: str | None, file_path: Path | None) -> str | None:
     parts: list[str] = []
 
     if file_path:
-        file_path = Path(file_path)
-        if file_path.exists():
-            file_text = read_text_file(file_path).strip()
-            if file_text:
-                parts.append(file_text)
+        file_text = read_text_file(file_path, missing_ok=True).strip()
+        if file_text:
+            parts.append(file_text)
 
     if inline:
         inline_text = inline.strip()
@@ -112,8 +128,7 @@ def resolve_user_prompt(
     def _from_user_prompt_dir() -> str:
         try:
             upath = Path(user_prompt_dir or cfg.user_prompt_dir) / "user.md"
-            if upath.exists():
-                return read_text_file(upath).strip()
+            return read_text_file(upath, missing_ok=True).strip()
         except Exception:
             logging.debug(
                 "Could not read user prompt in user prompt dir: %s",
@@ -8,10 +8,13 @@ Design goals:
 - Simple API: register_provider(name, factory) and get_provider(name)
 - Lazy imports: default providers are registered with factories that import on demand
 - Friendly errors: list available providers on unknown name
+- Instance reuse: get_provider() returns the same instance for the same config object,
+  so warmed-up HTTP clients (connection pool, TLS session) survive across calls
 """
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 
 from svx.core.config import Config
@@ -34,6 +37,11 @@ ProviderFactory = Callable[[Config | None], Provider]
 # Internal registry mapping provider name -> factory
 _registry: dict[str, ProviderFactory] = {}
 
+# Cached instances: provider name -> (config object it was built from, instance)
+_instances: dict[str, tuple[Config | None, Provider]] = {}
+# Serializes instance creation (the pipeline warms a provider up from a side thread)
+_instances_lock = threading.Lock()
+
 
 def register_provider(name: str, factory: ProviderFactory) -> None:
     """
@@ -44,23 +52,34 @@ def register_provider(name: str, factory: ProviderFactory) -> None:
     if not key:
         raise ValueError("Provider name cannot be empty.")
     _registry[key] = factory
+    _instances.pop(key, None)
 
 
 def get_provider(name: str, cfg: Config | None = None) -> Provider:
     """
     Retrieve a Provider instance by name.
 
+    The instance is cached and returned again for later calls with the same name and
+    the same `cfg` object (identity, since Config is mutable and unhashable). Built-in
+    providers are safe to share across threads.
+
     Raises:
         KeyError: if no provider is registered under that name.
     """
     register_default_providers()
     key = name.strip().lower()
-    try:
-        factory = _registry[key]
-    except KeyError as e:
-        available = ", ".join(sorted(_registry.keys())) or "(none)"
-        raise KeyError(f"Unknown provider '{name}'. Available: {available}") from e
-    return factory(cfg)
+    with _instances_lock:
+        cached = _instances.get(key)
+        if cached is not None and cached[0] is cfg:
+            return cached[1]
+        try:
+            factory = _registry[key]
+        except KeyError as e:
+            available = ", ".join(sorted(_registry.keys())) or "(none)"
+            raise KeyError(f"Unknown provider '{name}'. Available: {available}") from e
+        provider = factory(cfg)
+        _instances[key] = (cfg, provider)
+        return provider
 
 
 def available_providers() -> list[str]:
@@ -70,6 +70,10 @@ class Provider(Protocol):
     Required methods:
         transcribe: Perform audio transcription via a dedicated endpoint.
         chat: Transform text with a prompt via a text-based LLM.
+
+    Optional methods:
+        warm_up: Prepare the client (imports, connection setup) ahead of the first call;
+            the pipeline calls it in the background while recording.
     """
 
     # Short, unique name (e.g., "mistral", "whisper")
@@ -87,6 +91,10 @@ class Provider(Protocol):
         """
         Transcribe `audio_path` using a dedicated transcription endpoint.
 
+        The file must be complete: transcription endpoints take the whole audio in a
+        single upload, so callers keep latency down by making the file small and ready
+        early (on-the-fly encoding, chunking) rather than by streaming it.
+
         Args:
             audio_path: Path to an audio file (wav/mp3/opus...) to send to the provider.
             model: Optional provider-specific model identifier.
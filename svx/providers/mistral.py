@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any, cast
 
@@ -81,6 +82,9 @@ class MistralProvider(Provider):
 
     Uses the dedicated transcription endpoint for audio-to-text
     and the chat endpoint for text transformation via LLM.
+
+    A single SDK client is created lazily and reused by every call, so its HTTP
+    connection pool is shared (the client is thread-safe, e.g. for parallel chunks).
     """
 
     name = "mistral"
@@ -93,6 +97,35 @@ class MistralProvider(Provider):
         if not self.api_key:
             raise ProviderError("Missing providers.mistral.api_key in user config (config.toml).")
         self.context_bias = cfg.defaults.context_bias
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> Any:
+        """
+        Return the shared Mistral client, creating it on first use.
+
+        Raises:
+            ProviderError: if the 'mistralai' package cannot be imported.
+        """
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    from mistralai.client import Mistral
+                except Exception as e:
+                    raise ProviderError(
+                        "Failed to import 'mistralai'. Ensure the 'mistralai' package is installed."
+                    ) from e
+                self._client = Mistral(api_key=self.api_key)
+            return self._client
+
+    def warm_up(self) -> None:
+        """
+        Import the SDK and build the client ahead of the first request.
+
+        Called from a background thread while recording, so the first transcription
+        does not pay for it after the user stops.
+        """
+        self._get_client()
 
     def transcribe(
         self,
@@ -119,17 +152,10 @@ class MistralProvider(Provider):
         Raises:
             ProviderError: for expected configuration/import errors.
         """
-        try:
-            from mistralai.client import Mistral
-        except Exception as e:
-            raise ProviderError(
-                "Failed to import 'mistralai'. Ensure the 'mistralai' package is installed."
-            ) from e
-
         if not Path(audio_path).exists():
             raise ProviderError(f"Audio file not found: {audio_path}")
 
-        client = Mistral(api_key=self.api_key)
+        client = self._get_client()
 
         model_name = model or "voxtral-mini-latest"
         granularities = timestamp_granularities or (["segment"] if diarize else None)
@@ -195,14 +221,7 @@ class MistralProvider(Provider):
         Raises:
             ProviderError: for expected configuration/import errors.
         """
-        try:
-            from mistralai.client import Mistral
-        except Exception as e:
-            raise ProviderError(
-                "Failed to import 'mistralai'. Ensure the 'mistralai' package is installed."
-            ) from e
-
-        client = Mistral(api_key=self.api_key)
+        client = self._get_client()
 
         model_name = model or "mistral-small-latest"
         logging.info(
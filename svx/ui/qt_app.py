@@ -19,12 +19,34 @@ from __future__ import annotations
 
 import logging
 import math
+import sys
 import threading
 import time
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QPoint, QSettings, Qt, QTimer, QUrl, Signal
-from PySide6.QtGui import QAction, QDesktopServices, QFont, QFontDatabase, QKeySequence
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QPoint,
+    QRect,
+    QSettings,
+    Qt,
+    QThread,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import (
+    QColor,
+    QDesktopServices,
+    QFont,
+    QFontDatabase,
+    QPainter,
+    QPixmap,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -42,7 +64,7 @@ from PySide6.QtWidgets import (
 
 import svx.core.config as config
 from svx.core.config import Config
-from svx.core.pipeline import RecordingPipeline
+from svx.core.pipeline import PipelineCanceled, RecordingPipeline
 from svx.core.prompt import resolve_user_prompt
 
 __all__ = ["RecorderWindow", "run_gui"]
@@ -54,6 +76,15 @@ _KEY_KEEP_RAW_AUDIO = "keep_raw_audio"
 _KEY_KEEP_COMPRESSED_AUDIO = "keep_compressed_audio"
 _KEY_KEEP_TRANSCRIPT_FILES = "keep_transcript_files"
 
+# Platforms where the clipboard keeps our text after the app quits, so the result can be
+# set directly from the GUI thread. On X11/Wayland the owning process serves the clipboard
+# and the window closes right after copying: keep the pipeline's copy_to_clipboard there.
+_QT_OWNS_CLIPBOARD = sys.platform in ("darwin", "win32")
+
+# Minimum delay between two status signals sent by a worker (seconds, i.e. <= 10 Hz);
+# bursts are coalesced
+_STATUS_MIN_INTERVAL = 0.1
+
 # Simple dark monospace stylesheet
 DARK_MONO_STYLESHEET = """
 /* Base window */
@@ -157,6 +188,29 @@ QLabel#panel_header {
 }
 """
 
+# QApplication dynamic property marking that our stylesheet is applied (see run_gui)
+_STYLE_APPLIED_PROP = "svx_style_applied"
+
+# Invariant rich-text fragments for the window header and config info line
+_TITLE_HTML = (
+    "<span style='color:#1e3a52'>══</span>"
+    " <span style='color:#5a8fae'>SuperVoxtral</span> "
+    "<span style='color:#1e3a52'>══</span>"
+)
+_INFO_SEP = "<span style='color:#1c2e3c'> · </span>"
+# Config info line: model / chat model / audio format, then the optional {lang_part}
+_INFO_TEMPLATE = (
+    "<span style='color:#3d5a72'>model:</span> <span style='color:#6090b0'>{model}</span>"
+    + _INFO_SEP
+    + "<span style='color:#3d5a72'>llm:</span> <span style='color:#508070'>{chat_model}</span>"
+    + _INFO_SEP
+    + "<span style='color:#3d5a72'>audio format:</span> <span style='color:#906840'>{format}</span>"
+    + "{lang_part}"
+)
+_INFO_LANG = (
+    _INFO_SEP + "<span style='color:#3d5a72'>lang:</span> <span style='color:#705890'>{lang}</span>"
+)
+
 
 def get_fixed_font(point_size: int = 11) -> QFont:
     """
@@ -168,6 +222,29 @@ def get_fixed_font(point_size: int = 11) -> QFont:
     return f
 
 
+def _discard_bool(fn: Callable[[str], None], arg: str, _checked: bool = False) -> None:
+    """Slot adapter: call fn(arg), dropping the `checked` bool sent by `clicked`."""
+    fn(arg)
+
+
+def _ensure_app() -> QApplication:
+    """
+    Return the QApplication, creating it if needed and styling it exactly once.
+
+    The font and stylesheet must be set before any widget exists: re-setting them
+    forces Qt to restyle every existing widget. The "already styled" flag lives on the
+    QApplication itself, so a fresh application instance gets styled again.
+    """
+    app = QApplication.instance() or QApplication([])
+    if not isinstance(app, QApplication):
+        raise RuntimeError("A non-GUI QCoreApplication is already running.")
+    if not app.property(_STYLE_APPLIED_PROP):
+        app.setFont(get_fixed_font(11))
+        app.setStyleSheet(DARK_MONO_STYLESHEET)
+        app.setProperty(_STYLE_APPLIED_PROP, True)
+    return app
+
+
 class LevelMeterWidget(QWidget):
     """
     Compact horizontal audio level meter with a retro segmented look.
@@ -200,6 +277,24 @@ class LevelMeterWidget(QWidget):
         self._device_name = device_name
         self._display_level: float = 0.0
         self._peak: float = 0.0
+        # Segment geometry depends only on the widget size: computed in resizeEvent
+        self._seg_xs: list[int] = []
+        self._seg_w = 1
+        self._bar_y = 0
+        self._bar_rect = QRect()
+        # Unlit bar pre-rendered once per size; paints only add the lit segments on top
+        self._unlit_bar: QPixmap | None = None
+        # Label font and elided device name, built on first paint (reset on font change)
+        self._label_font: QFont | None = None
+        self._elided_device = ""
+        # Paint colours allocated once instead of on every repaint
+        self._label_color = QColor(100, 140, 172)
+        self._device_color = QColor(55, 82, 105)
+        self._off_color = QColor(*self._COL_OFF)
+        # (on, peak) colour per segment index: the zone lookup is done once, not per paint
+        self._seg_colors = [
+            (QColor(*on), QColor(*pk)) for on, pk in map(self._zone_colors, range(self._NUM_SEGS))
+        ]
         self.setMinimumHeight(36)
         self.setMaximumHeight(36)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
@@ -208,24 +303,74 @@ class LevelMeterWidget(QWidget):
         self._decay_timer.timeout.connect(self._decay)
         self._decay_timer.start()
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        self._decay_timer.start()
+        super().showEvent(event)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        bar_x = self._LABEL_W + 4
+        bar_w = max(1, self.width() - bar_x - 12)
+        self._bar_y = (self.height() - self._TRACK_H) // 2
+        self._seg_w = max(1, (bar_w - (self._NUM_SEGS - 1) * self._SEG_GAP) // self._NUM_SEGS)
+        step = self._seg_w + self._SEG_GAP
+        self._seg_xs = [bar_x + i * step for i in range(self._NUM_SEGS)]
+        self._bar_rect = QRect(bar_x, self._bar_y, bar_w, self._TRACK_H)
+        self._unlit_bar = None
+        super().resizeEvent(event)
+
+    def _render_unlit_bar(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        bar = self._bar_rect
+        pixmap = QPixmap(round(bar.width() * dpr), round(bar.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pixmap)
+        for x in self._seg_xs:
+            p.fillRect(x - bar.x(), 0, self._seg_w, self._TRACK_H, self._off_color)
+        p.end()
+        return pixmap
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        # Also delivered (spontaneously) when the window is minimized: no point
+        # animating a meter nobody can see.
+        self._decay_timer.stop()
+        super().hideEvent(event)
+
     def set_level(self, rms: float) -> None:
         """Update the meter with a new RMS value (0.0 .. 1.0)."""
         level = 0.0
         if rms > 1e-5:
             # Log scale: map [-50 dB, 0 dB] → [0, 1]
             level = max(0.0, min(1.0, (20 * math.log10(rms) + 50) / 50))
+        before = self._seg_state()
         if level > self._display_level:
             self._display_level = level
         if self._display_level > self._peak:
             self._peak = self._display_level
-        self.update()
+        # Only the segments change; the labels are repainted on resize/expose only
+        if self._seg_state() != before:
+            self.update(self._bar_rect)
+        if self._display_level > 0.0 and not self._decay_timer.isActive() and self.isVisible():
+            self._decay_timer.start()
+
+    def _seg_state(self) -> tuple[int, int]:
+        """Return (active segments, peak segment or -1): what a repaint would show."""
+        peak_seg = int(self._NUM_SEGS * self._peak) if self._peak > 0.04 else -1
+        return int(self._NUM_SEGS * self._display_level), peak_seg
 
     def _decay(self) -> None:
-        changed = self._display_level > 0.0 or self._peak > 0.0
-        self._display_level = max(0.0, self._display_level * 0.82)
-        self._peak = max(0.0, self._peak - 0.018)
-        if changed:
-            self.update()
+        before = self._seg_state()
+        self._display_level *= 0.82
+        if self._display_level < 1.0 / self._NUM_SEGS:
+            self._display_level = 0.0  # below one segment: nothing left to draw
+        self._peak -= 0.018
+        if self._peak <= 0.04:
+            self._peak = 0.0  # the peak segment is hidden below this level anyway
+        if self._seg_state() != before:
+            self.update(self._bar_rect)
+        if self._display_level == 0.0 and self._peak == 0.0:
+            # Meter at rest (silence): no ticks until set_level() brings signal again
+            self._decay_timer.stop()
 
     def _zone_colors(self, seg: int) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
         """Return (on_color, peak_color) for the given segment index."""
@@ -235,25 +380,25 @@ class LevelMeterWidget(QWidget):
             return self._COL_ON_MID, self._COL_PK_MID
         return self._COL_ON_LO, self._COL_PK_LO
 
-    def paintEvent(self, event) -> None:  # type: ignore[override]
-        from PySide6.QtGui import QColor, QPainter
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() == QEvent.Type.FontChange:
+            self._label_font = None
+        super().changeEvent(event)
 
+    def _paint_labels(self, p: QPainter) -> None:
         h = self.height()
-        bar_x = self._LABEL_W + 4
-        bar_w = max(1, self.width() - bar_x - 12)
-        bar_y = (h - self._TRACK_H) // 2
-
-        seg_w = max(1, (bar_w - (self._NUM_SEGS - 1) * self._SEG_GAP) // self._NUM_SEGS)
-
-        p = QPainter(self)
-
-        font = p.font()
+        if self._label_font is None:
+            self._label_font = QFont(self.font())
+            self._label_font.setPointSize(8)
+            p.setFont(self._label_font)
+            self._elided_device = p.fontMetrics().elidedText(
+                self._device_name, Qt.TextElideMode.ElideRight, self._LABEL_W - 2
+            )
+        p.setFont(self._label_font)
         if self._device_name:
             # Top half: short label ("MIC" / "LOOP") in muted blue-grey
             mid = h // 2
-            p.setPen(QColor(100, 140, 172))
-            font.setPointSize(8)
-            p.setFont(font)
+            p.setPen(self._label_color)
             p.drawText(
                 0,
                 0,
@@ -263,25 +408,18 @@ class LevelMeterWidget(QWidget):
                 self._label,
             )
             # Bottom half: device name, dimmer, elided if too long
-            p.setPen(QColor(55, 82, 105))
-            font.setPointSize(8)
-            p.setFont(font)
-            elided = p.fontMetrics().elidedText(
-                self._device_name, Qt.TextElideMode.ElideRight, self._LABEL_W - 2
-            )
+            p.setPen(self._device_color)
             p.drawText(
                 0,
                 mid,
                 self._LABEL_W,
                 h - mid,
                 int(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight),
-                elided,
+                self._elided_device,
             )
         else:
             # Single-line label (no device name)
-            p.setPen(QColor(100, 140, 172))
-            font.setPointSize(8)
-            p.setFont(font)
+            p.setPen(self._label_color)
             p.drawText(
                 0,
                 0,
@@ -291,22 +429,32 @@ class LevelMeterWidget(QWidget):
                 self._label,
             )
 
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        p = QPainter(self)
+        # set_level/_decay only invalidate the bar: skip the label text on those repaints
+        if event.rect().left() < self._LABEL_W:
+            self._paint_labels(p)
+
         active = int(self._NUM_SEGS * self._display_level)
         peak_seg = int(self._NUM_SEGS * self._peak)
         show_peak = self._peak > 0.04 and peak_seg < self._NUM_SEGS
 
-        for i in range(self._NUM_SEGS):
-            x = bar_x + i * (seg_w + self._SEG_GAP)
-            on_col, pk_col = self._zone_colors(i)
-            is_active = i < active
-            is_peak = show_peak and i == peak_seg and not is_active
-            if is_active:
-                r, g, b = on_col
-            elif is_peak:
-                r, g, b = pk_col
-            else:
-                r, g, b = self._COL_OFF
-            p.fillRect(x, bar_y, seg_w, self._TRACK_H, QColor(r, g, b))
+        # Rebuilt after a resize or when the window moved to a screen with another scale
+        if (
+            self._unlit_bar is None
+            or self._unlit_bar.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self._unlit_bar = self._render_unlit_bar()
+        p.drawPixmap(self._bar_rect.topLeft(), self._unlit_bar)
+
+        seg_w = self._seg_w
+        bar_y = self._bar_y
+        for i in range(min(active, self._NUM_SEGS)):
+            p.fillRect(self._seg_xs[i], bar_y, seg_w, self._TRACK_H, self._seg_colors[i][0])
+        if show_peak and peak_seg >= active:
+            p.fillRect(
+                self._seg_xs[peak_seg], bar_y, seg_w, self._TRACK_H, self._seg_colors[peak_seg][1]
+            )
 
 
 class AudioLevelMonitor(QObject):
@@ -335,18 +483,30 @@ class AudioLevelMonitor(QObject):
         self._timer = QTimer(self)
         self._timer.setInterval(50)  # 20 Hz
         self._timer.timeout.connect(self._emit_and_decay)
+        self._active = False
 
     def start(self) -> None:
         # No stream opening needed: the recording pipeline feeds levels via its
         # own callbacks (push mode). Just start the polling timer.
+        self._active = True
         self._timer.start()
 
     def stop(self) -> None:
+        self._active = False
         self._timer.stop()
         self._core.stop()
         self._mic_rms = 0.0
         self._loop_rms = 0.0
 
+    def pause(self) -> None:
+        """Suspend polling without resetting state (e.g. while the window is minimized)."""
+        self._timer.stop()
+
+    def resume(self) -> None:
+        """Resume polling after pause(), unless the monitor has been stopped meanwhile."""
+        if self._active:
+            self._timer.start()
+
     def _emit_and_decay(self) -> None:
         mic_peak, loop_peak = self._core.get_and_reset_peaks()
         # Peak-hold with decay so the meter falls smoothly between frames
@@ -359,10 +519,73 @@ class AudioLevelMonitor(QObject):
         self.levels.emit(self._mic_rms, loop_out)
 
 
+class _StatusCoalescer:
+    """
+    Rate-limit status updates sent from a worker thread to the UI.
+
+    At most one message is emitted per _STATUS_MIN_INTERVAL. Messages arriving faster
+    are held in a single pending slot and a deferred flush delivers only the latest one.
+    Phase transitions the UI reacts to are sent with `force=True` so they are never
+    dropped, and `flush()` is called before a final signal so no status arrives late.
+    A message identical to the last one delivered is not emitted again.
+    """
+
+    def __init__(self, emit: Callable[[str], None]) -> None:
+        self._emit = emit
+        self._lock = threading.Lock()
+        self._pending: str | None = None
+        self._last_sent: str | None = None
+        self._last_emit = 0.0
+        self._timer: threading.Timer | None = None
+
+    def __call__(self, msg: str, force: bool = False) -> None:
+        with self._lock:
+            if msg == self._last_sent and self._timer is None:
+                return
+            self._pending = msg
+            if force:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._emit_pending()
+                return
+            if self._timer is not None:
+                return
+            wait = self._last_emit + _STATUS_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+            self._emit_pending()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._emit_pending()
+
+    def _emit_pending(self) -> None:
+        # Caller holds _lock
+        msg = self._pending
+        if msg is None:
+            return
+        self._pending = None
+        if msg == self._last_sent:
+            return
+        self._last_sent = msg
+        self._last_emit = time.monotonic()
+        self._emit(msg)
+
+
 class RecorderWorker(QObject):
     """
     Worker object running the audio/transcription pipeline in a background thread.
 
+    The worker is moved to a dedicated QThread and `run` is started from the thread's
+    `started` signal, so its signals are delivered to the UI as queued connections.
+
     Signals:
         status (str): human-readable status updates for the UI.
         done (str): emitted with the final transcription text on success.
@@ -392,13 +615,18 @@ class RecorderWorker(QObject):
         self.outfile_prefix = outfile_prefix
         self.level_monitor = level_monitor
         self.mode: str | None = None
-        self.cancel_requested: bool = False
         self._force_discard: bool = False
         self.review_mode = review_mode
         self._stop_event = threading.Event()
+        # Shared with the pipeline, which checks it between processing steps
+        self._cancel_event = threading.Event()
+        self._mode_event = threading.Event()
+        self._cached_prompts: dict[str, str] = {}
+        self._post_status = _StatusCoalescer(self.status.emit)
 
     def set_mode(self, mode: str) -> None:
         self.mode = mode
+        self._mode_event.set()
 
     def set_review_mode(self, value: bool) -> None:
         self.review_mode = value
@@ -408,21 +636,40 @@ class RecorderWorker(QObject):
         self._stop_event.set()
 
     def cancel(self) -> None:
-        self.cancel_requested = True
+        self._cancel_event.set()
         self._stop_event.set()
+        self._mode_event.set()
 
     def cancel_discard(self) -> None:
         """Cancel and force-discard the recording regardless of keep_raw settings."""
         self._force_discard = True
-        self.cancel_requested = True
-        self._stop_event.set()
+        self.cancel()
+
+    def _discard(self, pipeline: RecordingPipeline, wav_path: Path) -> None:
+        """Clean up after a cancel (honouring keep settings unless force-discarding)."""
+        keep_raw = (
+            False if self._force_discard else (self.save_all or self.cfg.defaults.keep_raw_audio)
+        )
+        keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
+        pipeline.clean(
+            wav_path, {"wav": wav_path}, keep_raw=keep_raw, keep_compressed=keep_compressed
+        )
+        self._post_status.flush()
+        self.canceled.emit()
 
     def _resolve_user_prompt(self, key: str) -> str:
         """
         Determine the final user prompt using the shared resolver for the given key.
+
+        Results are memoized per key for the lifetime of the worker.
         """
-        return resolve_user_prompt(self.cfg, None, None, self.cfg.user_prompt_dir, key=key)
+        prompt = self._cached_prompts.get(key)
+        if prompt is None:
+            prompt = resolve_user_prompt(self.cfg, None, None, self.cfg.user_prompt_dir, key=key)
+            self._cached_prompts[key] = prompt
+        return prompt
 
+    @Slot()
     def run(self) -> None:
         """
         Execute the pipeline:
@@ -439,42 +686,37 @@ class RecorderWorker(QObject):
                 user_prompt_file=self.user_prompt_file,
                 save_all=self.save_all,
                 outfile_prefix=self.outfile_prefix,
-                progress_callback=self.status.emit,
+                progress_callback=self._post_status,
                 level_monitor=self.level_monitor,
+                cancel_event=self._cancel_event,
             )
-            self.status.emit("Recording in progress...")
+            self._post_status("Recording in progress...", force=True)
             wav_path, duration = pipeline.record(self._stop_event)
-            self.status.emit("Recording finished.")
-            if self.cancel_requested:
-                keep_raw = (
-                    False
-                    if self._force_discard
-                    else (self.save_all or self.cfg.defaults.keep_raw_audio)
-                )
-                keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
-                pipeline.clean(
-                    wav_path, {"wav": wav_path}, keep_raw=keep_raw, keep_compressed=keep_compressed
-                )
-                self.canceled.emit()
+            self._post_status("Recording finished.", force=True)
+            # Wait for user to select mode in the GUI (cancel also wakes us up)
+            self._mode_event.wait()
+            if self._cancel_event.is_set():
+                self._discard(pipeline, wav_path)
                 return
-            self.status.emit("Processing in progress...")
-            # Wait for user to select mode in the GUI
-            while self.mode is None:
-                time.sleep(0.05)
+            # The event is only set by set_mode() or cancel(), and cancel returned above
+            mode = self.mode
+            if mode is None:
+                raise RuntimeError("mode not selected")
+            self._post_status("Processing in progress...", force=True)
 
             # Log the selected mode/key for debugging prompt application
             try:
-                logging.info("RecorderWorker: selected mode/key: %s", self.mode)
+                logging.info("RecorderWorker: selected mode/key: %s", mode)
             except Exception:
                 # ensure failures in logging don't break the worker
                 pass
 
-            transcribe_mode = self.mode == "transcribe"
+            transcribe_mode = mode == "transcribe"
             if transcribe_mode:
                 user_prompt = None
             else:
                 # Resolve the user prompt for the selected key and log a short snippet
-                user_prompt = self._resolve_user_prompt(self.mode)
+                user_prompt = self._resolve_user_prompt(mode)
                 try:
                     if user_prompt:
                         snippet = (
@@ -484,7 +726,7 @@ class RecorderWorker(QObject):
                         snippet = "<EMPTY>"
                     logging.info(
                         "RecorderWorker: resolved prompt snippet for key '%s': %s",
-                        self.mode,
+                        mode,
                         snippet,
                     )
                 except Exception:
@@ -493,15 +735,27 @@ class RecorderWorker(QObject):
 
             if self.review_mode:
                 self.cfg.defaults.copy = False
-            result = pipeline.process(wav_path, duration, transcribe_mode, user_prompt)
+            try:
+                result = pipeline.process(wav_path, duration, transcribe_mode, user_prompt)
+            except PipelineCanceled:
+                logging.info("Processing canceled")
+                self._discard(pipeline, wav_path)
+                return
+            self._post_status.flush()
+            self.done.emit(result["text"], result["raw_transcript"], result["paths"])
+            # Clean up once the UI has the result, silently (the window may be closing)
             keep_raw = self.save_all or self.cfg.defaults.keep_raw_audio
             keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
-            pipeline.clean(
-                wav_path, result["paths"], keep_raw=keep_raw, keep_compressed=keep_compressed
-            )
-            self.done.emit(result["text"], result["raw_transcript"], result["paths"])
+            pipeline.progress_callback = None
+            try:
+                pipeline.clean(
+                    wav_path, result["paths"], keep_raw=keep_raw, keep_compressed=keep_compressed
+                )
+            except Exception:
+                logging.exception("Cleanup failed")
         except Exception as e:
             logging.exception("Pipeline failed")
+            self._post_status.flush()
             self.error.emit(str(e))
 
 
@@ -509,17 +763,20 @@ class ProcessFileWorker(QObject):
     """
     Worker that runs an existing audio file through the transcription pipeline in a background
     thread. Unlike RecorderWorker, there is no recording step — the file is fed directly into
-    pipeline.process().
+    pipeline.process(). Like RecorderWorker, it is moved to a QThread and started from the
+    thread's `started` signal.
 
     Signals:
         status (str): human-readable status updates for the UI.
         done (str, str, object): emitted with (text, raw_transcript, paths) on success.
         error (str): emitted with an error message on failure.
+        canceled: emitted once processing stopped after cancel().
     """
 
     status = Signal(str)
     done = Signal(str, str, object)  # text, raw_transcript, paths
     error = Signal(str)
+    canceled = Signal()
 
     def __init__(
         self,
@@ -533,10 +790,17 @@ class ProcessFileWorker(QObject):
         self.audio_path = audio_path
         self.mode = mode
         self.save_all = save_all
+        # Shared with the pipeline, which checks it between processing steps
+        self._cancel_event = threading.Event()
+        self._post_status = _StatusCoalescer(self.status.emit)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
 
     def _resolve_user_prompt(self, key: str) -> str:
         return resolve_user_prompt(self.cfg, None, None, self.cfg.user_prompt_dir, key=key)
 
+    @Slot()
     def run(self) -> None:
         pipeline: RecordingPipeline | None = None
         try:
@@ -548,21 +812,35 @@ class ProcessFileWorker(QObject):
             pipeline = RecordingPipeline(
                 cfg=self.cfg,
                 save_all=self.save_all,
-                progress_callback=self.status.emit,
-            )
-            self.status.emit(f"Processing {self.audio_path.name}...")
-            result = pipeline.process(self.audio_path, 0.0, transcribe_mode, user_prompt)
-            keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
-            # keep_raw=True is mandatory — never delete the user's original file
-            pipeline.clean(
-                self.audio_path, result["paths"], keep_raw=True, keep_compressed=keep_compressed
+                progress_callback=self._post_status,
+                cancel_event=self._cancel_event,
             )
+            self._post_status(f"Processing {self.audio_path.name}...")
+            try:
+                result = pipeline.process(self.audio_path, 0.0, transcribe_mode, user_prompt)
+            except PipelineCanceled:
+                logging.info("File processing canceled")
+                pipeline.clean(self.audio_path, {}, keep_raw=True, keep_compressed=False)
+                self._post_status.flush()
+                self.canceled.emit()
+                return
+            self._post_status.flush()
             self.done.emit(result["text"], result["raw_transcript"], result["paths"])
+            keep_compressed = self.save_all or self.cfg.defaults.keep_compressed_audio
+            pipeline.progress_callback = None
+            try:
+                # keep_raw=True is mandatory — never delete the user's original file
+                pipeline.clean(
+                    self.audio_path, result["paths"], keep_raw=True, keep_compressed=keep_compressed
+                )
+            except Exception:
+                logging.exception("Cleanup failed")
         except Exception as e:
             logging.exception("File processing pipeline failed")
             # Ensure temp dirs are cleaned up even when process() raised before clean() was called
             if pipeline is not None:
                 pipeline.clean(self.audio_path, {}, keep_raw=True, keep_compressed=False)
+            self._post_status.flush()
             self.error.emit(str(e))
 
 
@@ -585,8 +863,12 @@ class ResultDialog(QDialog):
         self._drag_pos = QPoint(0, 0)
 
         self.setWindowTitle("SuperVoxtral — Review")
-        self.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
+        # One flags update before the first show (each change may recreate the native window)
+        self.setWindowFlags(
+            self.windowFlags()
+            | Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.WindowStaysOnTopHint
+        )
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 12, 12, 12)
@@ -719,7 +1001,7 @@ class RecorderWindow(QWidget):
     Launching this window will immediately start the recording in a background thread.
 
     Window can be dragged by clicking anywhere on the widget background.
-    Pressing Esc triggers Prompt mode.
+    Pressing Esc cancels, like the Cancel button.
     """
 
     def __init__(
@@ -730,6 +1012,7 @@ class RecorderWindow(QWidget):
         save_all: bool = False,
         outfile_prefix: str | None = None,
     ) -> None:
+        _ensure_app()  # no-op when run_gui already created and styled the application
         super().__init__()
 
         self.cfg = cfg
@@ -756,6 +1039,11 @@ class RecorderWindow(QWidget):
         self.cfg.defaults.keep_raw_audio = _keep_raw
         self.cfg.defaults.keep_compressed_audio = _keep_compressed
         self.cfg.defaults.keep_transcript_files = _keep_transcripts
+        # Copy the result from _on_done instead of spawning a clipboard tool in the worker
+        self._copy_in_ui = self.cfg.defaults.copy and _QT_OWNS_CLIPBOARD
+        self._copy_result = False
+        if self._copy_in_ui:
+            self.cfg.defaults.copy = False
 
         # Audio level monitor — created first so its core can be shared with the worker.
         # The pipeline feeds levels via its recording callbacks (push mode); no extra
@@ -775,14 +1063,45 @@ class RecorderWindow(QWidget):
             outfile_prefix=outfile_prefix,
             level_monitor=self._level_monitor._core,
         )
-        self._thread = threading.Thread(target=self._worker.run, daemon=True)
+        self._qthread = QThread(self)
+        self._qthread.setObjectName("svx-recorder")
+        self._worker.moveToThread(self._qthread)
+        self._qthread.started.connect(self._worker.run)
+        self._worker.done.connect(self._qthread.quit)
+        self._worker.error.connect(self._qthread.quit)
+        self._worker.canceled.connect(self._qthread.quit)
+
+        # Signals wiring
+        # Explicitly queued: worker signals must never run UI code on the worker thread
+        self._worker.status.connect(self._on_status, Qt.ConnectionType.QueuedConnection)
+        self._worker.done.connect(self._on_done, Qt.ConnectionType.QueuedConnection)
+        self._worker.error.connect(self._on_error, Qt.ConnectionType.QueuedConnection)
+        self._worker.canceled.connect(self.close, Qt.ConnectionType.QueuedConnection)
+
+        # Set once closeEvent has shut the worker down: later close() calls just close
+        self._closing = False
+        # True between the user's action choice and done/error (a billable API call in flight)
+        self._awaiting_result = False
+        self._finish_in_background = False
+        # Set when the window is hidden before it really closes: Qt only quits on the
+        # last window closed when that window was visible, so closeEvent quits itself.
+        self._quit_on_close = False
+
+        # Start recording before building the UI, so the mic is live as early as possible.
+        # Worker signals are queued: they reach the handlers once the event loop runs,
+        # after the widgets exist.
+        self._qthread.start()
+        QApplication.beep()
 
         # Window basics
         self.setObjectName("recorder_window")
         self.setWindowTitle("SuperVoxtral")
-        # Frameless and always on top
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-        self.setWindowFlag(Qt.WindowType.FramelessWindowHint, True)
+        # Frameless and always on top, set in one flags update before the first show
+        self.setWindowFlags(
+            self.windowFlags()
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.FramelessWindowHint
+        )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
         self.setMinimumWidth(360)
 
@@ -790,18 +1109,17 @@ class RecorderWindow(QWidget):
         self._drag_active = False
         self._drag_pos = QPoint(0, 0)
 
+        # Build the whole widget tree with updates off: one layout/paint pass at the end
+        # instead of one per added widget (the prompt buttons scale with the config)
+        self.setUpdatesEnabled(False)
+
         # UI layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(6)
 
         # Title
-        title_html = (
-            "<span style='color:#1e3a52'>══</span>"
-            " <span style='color:#5a8fae'>SuperVoxtral</span> "
-            "<span style='color:#1e3a52'>══</span>"
-        )
-        title_label = QLabel(title_html)
+        title_label = QLabel(_TITLE_HTML)
         title_label.setTextFormat(Qt.TextFormat.RichText)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
@@ -826,30 +1144,16 @@ class RecorderWindow(QWidget):
         self._level_monitor.levels.connect(self._on_levels)
 
         # Config info line: model / chat model / audio format / language
-        _k = "color:#3d5a72"  # key label colour (dimmed)
-        _sep = "<span style='color:#1c2e3c'> · </span>"
-        model_html = (
-            f"<span style='{_k}'>model:</span> "
-            f"<span style='color:#6090b0'>{self.cfg.defaults.model}</span>"
+        language = self.cfg.defaults.language
+        info_html = _INFO_TEMPLATE.format(
+            model=self.cfg.defaults.model,
+            chat_model=self.cfg.defaults.chat_model,
+            format=self.cfg.defaults.format,
+            lang_part=_INFO_LANG.format(lang=language) if language else "",
         )
-        chat_model_html = (
-            f"<span style='{_k}'>llm:</span> "
-            f"<span style='color:#508070'>{self.cfg.defaults.chat_model}</span>"
-        )
-        format_html = (
-            f"<span style='{_k}'>audio format:</span> "
-            f"<span style='color:#906840'>{self.cfg.defaults.format}</span>"
-        )
-        info_parts = [model_html, chat_model_html, format_html]
-        if self.cfg.defaults.language:
-            lang_html = (
-                f"<span style='{_k}'>lang:</span> "
-                f"<span style='color:#705890'>{self.cfg.defaults.language}</span>"
-            )
-            info_parts.append(lang_html)
         _bar_offset = LevelMeterWidget._LABEL_W + 4  # align with bar start
 
-        self._info_label = QLabel(_sep.join(info_parts))
+        self._info_label = QLabel(info_html)
         self._info_label.setObjectName("info_label")
         self._info_label.setTextFormat(Qt.TextFormat.RichText)
         self._info_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -896,6 +1200,7 @@ class RecorderWindow(QWidget):
         # Status line
         layout.addSpacing(16)
         self._status_label = QLabel("")
+        self._last_status: str | None = None
         self._status_label.setObjectName("status_label")
         self._status_label.setTextFormat(Qt.TextFormat.RichText)
         self._status_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -914,14 +1219,14 @@ class RecorderWindow(QWidget):
         self._transcribe_btn = QPushButton("Transcribe")
         self._transcribe_btn.setToolTip("Stop and transcribe without prompt")
         self._transcribe_btn.clicked.connect(
-            lambda checked=False, m="transcribe": self._on_mode_selected(m)
+            partial(_discard_bool, self._on_mode_selected, "transcribe")
         )
         button_layout.addWidget(self._transcribe_btn)
         self._prompt_buttons: dict[str, QPushButton] = {}
         for key in self.prompt_keys:
             btn = QPushButton(key.capitalize())
             btn.setToolTip(f"Stop and transcribe with '{key}' prompt")
-            btn.clicked.connect(lambda checked=False, k=key: self._on_mode_selected(k))
+            btn.clicked.connect(partial(_discard_bool, self._on_mode_selected, key))
             self._prompt_buttons[key] = btn
             button_layout.addWidget(btn)
         self._cancel_btn = QPushButton("Cancel")
@@ -945,51 +1250,33 @@ class RecorderWindow(QWidget):
         file_btn_layout.addWidget(self._process_file_btn)
         file_btn_layout.addStretch()
         layout.addLayout(file_btn_layout)
+        self.setUpdatesEnabled(True)
+        self.adjustSize()
 
         self._action_buttons = [self._transcribe_btn] + list(self._prompt_buttons.values())
         self._file_worker: ProcessFileWorker | None = None
-        self._file_thread: threading.Thread | None = None
+        self._file_qthread: QThread | None = None
         self._pending_file: Path | None = None  # set when a file is loaded, waiting for mode
 
-        # Keyboard shortcut: Esc → cancel / close
-        stop_action = QAction(self)
-        stop_action.setShortcut(QKeySequence.StandardKey.Cancel)  # Esc
-        stop_action.triggered.connect(self._on_cancel_clicked)
-        self.addAction(stop_action)
-
-        # Signals wiring
-        self._worker.status.connect(self._on_status)
-        self._worker.done.connect(self._on_done)
-        self._worker.error.connect(self._on_error)
-        self._worker.canceled.connect(self._close_soon)
-
-        # Apply stylesheet to the application for consistent appearance
-        app = QApplication.instance()
-        # Narrow the type to QApplication before accessing styleSheet/setStyleSheet
-        if isinstance(app, QApplication):
-            # Set system fixed-width font and merge stylesheet conservatively
-            app.setFont(get_fixed_font(11))
-            existing = app.styleSheet() or ""
-            app.setStyleSheet(existing + DARK_MONO_STYLESHEET)
-
         # Elapsed-time timer — updated every second while recording
         self._record_start_time: float | None = None
         self._elapsed_timer = QTimer(self)
         self._elapsed_timer.setInterval(1000)
         self._elapsed_timer.timeout.connect(self._update_elapsed_display)
 
-        # Start recording and level monitoring simultaneously
-        self._thread.start()
+        # Level monitoring starts once the meters exist
         self._level_monitor.start()
-        QApplication.beep()
-
-        # Ensure proper shutdown if user closes the window directly
-        self._closing = False
-        self._schedule_topmost_refresh()
-
-    def _schedule_topmost_refresh(self) -> None:
-        # Some WMs may ignore the first set; nudge it again shortly after show.
-        QTimer.singleShot(50, lambda: self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True))
+        self._topmost_refreshed = False
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        # Some X11 WMs ignore the on-top hint on first map; raise the window once there
+        # instead of re-setting the flag, which would recreate the native window. Other
+        # platforms honour the hint and need no extra round trip.
+        super().showEvent(event)
+        if not self._topmost_refreshed and QApplication.platformName() == "xcb":
+            self._topmost_refreshed = True
+            self.raise_()
+            self.activateWindow()
 
     def _on_levels(self, mic_rms: float, loop_rms: float) -> None:
         self._mic_meter.set_level(mic_rms)
@@ -1012,14 +1299,32 @@ class RecorderWindow(QWidget):
         self._set_status(f"Recording in progress... {mins:02d}:{secs:02d}")
 
     def _set_status(self, msg: str) -> None:
+        # Re-setting identical rich text still re-parses the HTML and relayouts the label
+        if msg == self._last_status:
+            return
+        self._last_status = msg
         self._status_label.setText(
             f"<span style='color:#3d5a72'>Status:</span> <span style='color:#cfe8ff'>{msg}</span>"
         )
 
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        # Stop polling levels while minimized; the meters cannot be seen anyway.
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self._level_monitor.pause()
+            else:
+                self._level_monitor.resume()
+        super().changeEvent(event)
+
     def _on_done(self, text: str, raw_transcript: str, paths: object) -> None:
+        self._level_monitor.stop()
         self._set_status("Done.")
+        self._awaiting_result = False
+        if self._copy_result:
+            QApplication.clipboard().setText(text)
+            logging.info("Copied transcription to clipboard")
         QApplication.beep()
-        if self._review_mode:
+        if self._review_mode and not self._finish_in_background:
             self.hide()
             dialog = ResultDialog(
                 text=text,
@@ -1028,9 +1333,9 @@ class RecorderWindow(QWidget):
                 parent=None,
             )
             dialog.exec()
-            self.close()
-        else:
-            self._close_soon()
+        # Close right away: the result is in the clipboard (or was reviewed), and a "Done."
+        # dwell time would only delay the paste
+        self.close()
 
     def _on_review_mode_changed(self, checked: bool) -> None:
         self._review_mode = checked
@@ -1052,22 +1357,65 @@ class RecorderWindow(QWidget):
         QDesktopServices.openUrl(QUrl.fromLocalFile(str(config.USER_DATA_DIR)))
 
     def _on_error(self, message: str) -> None:
+        self._level_monitor.stop()
+        self._awaiting_result = False
         QApplication.beep()
         QMessageBox.critical(self, "SuperVoxtral", f"Error: {message}")
-        self._close_soon()
+        self.close()
 
-    def _close_soon(self) -> None:
-        if not self._closing:
-            self._closing = True
-            QTimer.singleShot(200, self.close)
+    def _still_processing(self, timeout_ms: int) -> bool:
+        """Give in-flight processing a short grace period; return True if it is still running."""
+        if not self._awaiting_result:
+            return False
+        if self._file_qthread is not None:
+            return not self._file_qthread.wait(timeout_ms)
+        return not self._qthread.wait(timeout_ms)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
+        if self._closing:
+            super().closeEvent(event)
+            return
         # Attempt to stop recording if the user closes the window via window controls.
         self._elapsed_timer.stop()
         self._level_monitor.stop()
+        if self._still_processing(200):
+            # Quitting now would abort the upload/API call that is already paid for.
+            reply = QMessageBox.question(
+                self,
+                "SuperVoxtral",
+                "Processing is still in progress.\n"
+                "Close the window and let it finish in the background?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes,
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                # _on_done/_on_error close the window again once the worker is finished.
+                self._finish_in_background = True
+                self._quit_on_close = True
+                self.hide()
+            event.ignore()
+            return
         self._worker.cancel()
-        # File processing runs in a daemon thread; no explicit stop needed.
+        if self._file_worker is not None:
+            self._file_worker.cancel()
+        # Let the workers unwind (recording stops on cancel) before Qt tears the threads down.
+        for thread in (self._qthread, self._file_qthread):
+            if thread is None:
+                continue
+            thread.quit()
+            if not thread.wait(2000):
+                # Still unwinding (e.g. a request in flight after Esc): never block the UI or
+                # destroy a running QThread; close for real once the thread has finished.
+                self._finish_in_background = True
+                self._quit_on_close = True
+                self.hide()
+                thread.finished.connect(self.close, Qt.ConnectionType.SingleShotConnection)
+                event.ignore()
+                return
+        self._closing = True
         super().closeEvent(event)
+        if self._quit_on_close:
+            QApplication.quit()
 
     def _freeze_controls(self) -> None:
         """Disable all interactive controls once processing or cancel is triggered."""
@@ -1102,14 +1450,16 @@ class RecorderWindow(QWidget):
         # Redirect the canceled signal: instead of closing the window, show the
         # "file loaded" state so the user can pick a mode from the existing buttons.
         try:
-            self._worker.canceled.disconnect(self._close_soon)
+            self._worker.canceled.disconnect(self.close)
         except RuntimeError:
             pass
         try:
             self._worker.canceled.disconnect(self._on_recording_discarded_for_file)
         except RuntimeError:
             pass
-        self._worker.canceled.connect(self._on_recording_discarded_for_file)
+        self._worker.canceled.connect(
+            self._on_recording_discarded_for_file, Qt.ConnectionType.QueuedConnection
+        )
         self._worker.cancel_discard()
 
     def _on_recording_discarded_for_file(self) -> None:
@@ -1126,25 +1476,36 @@ class RecorderWindow(QWidget):
             mode=mode,
             save_all=self.save_all,
         )
-        self._file_thread = threading.Thread(target=self._file_worker.run, daemon=True)
-        self._file_worker.status.connect(self._on_status)
-        self._file_worker.done.connect(self._on_done)
-        self._file_worker.error.connect(self._on_error)
-        self._file_thread.start()
+        self._file_qthread = QThread(self)
+        self._file_qthread.setObjectName("svx-process-file")
+        self._file_worker.moveToThread(self._file_qthread)
+        self._file_qthread.started.connect(self._file_worker.run)
+        self._file_worker.done.connect(self._file_qthread.quit)
+        self._file_worker.error.connect(self._file_qthread.quit)
+        self._file_worker.canceled.connect(self._file_qthread.quit)
+        self._file_worker.status.connect(self._on_status, Qt.ConnectionType.QueuedConnection)
+        self._file_worker.done.connect(self._on_done, Qt.ConnectionType.QueuedConnection)
+        self._file_worker.error.connect(self._on_error, Qt.ConnectionType.QueuedConnection)
+        self._file_worker.canceled.connect(self.close, Qt.ConnectionType.QueuedConnection)
+        self._file_qthread.start()
 
     def _on_mode_selected(self, mode: str) -> None:
         self._elapsed_timer.stop()
         self._level_monitor.stop()
         self._freeze_controls()
+        self._awaiting_result = True
         if self._pending_file is not None:
             # File-loaded state: process the pending file with the chosen mode
             audio_path = self._pending_file
             self._pending_file = None
             self._set_status(f"Processing {audio_path.name}...")
+            self._copy_result = self._copy_in_ui
             self._start_file_processing(audio_path, mode)
         else:
             # Normal recording state: stop recording and process the WAV
             self._set_status("Stopping and processing...")
+            # Review mode never auto-copies a recording (the dialog has copy buttons)
+            self._copy_result = self._copy_in_ui and not self._review_mode
             self._worker.set_review_mode(self._review_mode)
             self._worker.set_mode(mode)
             self._worker.stop()
@@ -1156,10 +1517,14 @@ class RecorderWindow(QWidget):
         if self._pending_file is not None:
             # File-loaded state: discard the pending file and close
             self._pending_file = None
-            self._close_soon()
+            self.close()
         else:
+            # Also aborts processing (recording or file) at the pipeline's next step boundary
+            self._awaiting_result = False
             self._set_status("Canceling...")
             self._worker.cancel()
+            if self._file_worker is not None:
+                self._file_worker.cancel()
 
     # --- Drag handling for frameless window ---
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
@@ -1188,6 +1553,7 @@ class RecorderWindow(QWidget):
 
     # Support pressing Esc as an alternative to clicking Cancel
     def keyPressEvent(self, event) -> None:  # type: ignore[override]
+        # Esc → cancel / close (the only Esc handler: no QAction shortcut as well)
         if event.key() == Qt.Key.Key_Escape:
             self._on_cancel_clicked()
         else:
@@ -1207,16 +1573,7 @@ def run_gui(
         cfg = Config.load(log_level=log_level)
     config.setup_environment(log_level=log_level)
 
-    app = QApplication.instance() or QApplication([])
-    if isinstance(app, QApplication):
-        app.setFont(get_fixed_font(11))
-
-    # Ensure our stylesheet is applied as early as possible
-    # Narrow runtime type before calling QWidget-specific methods to satisfy static checkers.
-    if isinstance(app, QApplication):
-        existing = app.styleSheet() or ""
-        app.setStyleSheet(existing + DARK_MONO_STYLESHEET)
-
+    app = _ensure_app()
     window = RecorderWindow(
         cfg=cfg,
         user_prompt=user_prompt,
@@ -229,9 +229,11 @@ class RecorderWorker:
         self.cancel_requested: bool = False
         self._force_discard: bool = False
         self._stop_event = threading.Event()
+        self._mode_event = threading.Event()
 
     def set_mode(self, mode: str) -> None:
         self.mode = mode
+        self._mode_event.set()
 
     def set_review_mode(self, value: bool) -> None:
         self.review_mode = value
@@ -242,11 +244,13 @@ class RecorderWorker:
     def cancel(self) -> None:
         self.cancel_requested = True
         self._stop_event.set()
+        self._mode_event.set()
 
     def cancel_discard(self) -> None:
         self._force_discard = True
         self.cancel_requested = True
         self._stop_event.set()
+        self._mode_event.set()
 
     def _emit(self, event: str, payload: Any = None) -> None:
         self._queue.put((event, payload))
@@ -269,6 +273,8 @@ class RecorderWorker:
             wav_path, duration = pipeline.record(self._stop_event)
             self._emit("status", "Recording finished.")
 
+            # Wait for the user to pick a mode (cancel also wakes us up)
+            self._mode_event.wait()
             if self.cancel_requested:
                 keep_raw = (
                     False
@@ -281,16 +287,18 @@ class RecorderWorker:
                 )
                 self._emit("canceled")
                 return
+            # The event is only set by set_mode() or cancel(), and cancel returned above
+            mode = self.mode
+            if mode is None:
+                raise RuntimeError("mode not selected")
 
             self._emit("status", "Processing in progress...")
-            while self.mode is None:
-                time.sleep(0.05)
 
-            logging.info("RecorderWorker: selected mode/key: %s", self.mode)
-            transcribe_mode = self.mode == "transcribe"
+            logging.info("RecorderWorker: selected mode/key: %s", mode)
+            transcribe_mode = mode == "transcribe"
             user_prompt: str | None = None
             if not transcribe_mode:
-                user_prompt = self._resolve_user_prompt(self.mode)
+                user_prompt = self._resolve_user_prompt(mode)
 
             if self.review_mode:
                 self.cfg.defaults.copy = False